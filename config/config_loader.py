@@ -6,51 +6,218 @@ with support for environment variable overrides and default values.
 """
 
 import os
-import yaml
+import sys
+import json
+import hashlib
+import logging
+import tempfile
+import functools
+from types import MappingProxyType
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-from dataclasses import dataclass, field
-from copy import deepcopy
+from typing import Any, Dict, Mapping, Optional, Union
+from dataclasses import dataclass, field, fields, replace
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    """
+    Import PyYAML on first use.
+    
+    Code that only needs the config dataclasses (or hits the JSON cache)
+    never pays for the yaml import.
+    
+    Returns:
+        tuple: (yaml module, SafeLoader class, SafeDumper class), preferring
+        the LibYAML bindings when PyYAML was built with them.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+def __getattr__(name: str):
+    # Keep ``config_loader.yaml`` available without importing it eagerly
+    if name == 'yaml':
+        return _yaml()[0]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_raw(path_str: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML configuration file.
+    
+    Results are cached per (path, mtime, size), so reloading an unchanged
+    file skips the YAML parse. Across processes, a JSON copy of the parse
+    in the user cache directory is used instead while it was made from a
+    file with exactly this mtime and size. The returned dict is shared
+    between callers and must not be mutated.
+    """
+    source = {'path': path_str, 'mtime_ns': mtime_ns, 'size': size}
+    cache_path = _json_cache_path(path_str)
+    
+    # Fast path: JSON cache written by a previous run for this exact file
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached.get('source') == source:
+            return cached['data']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    # One read() into bytes; LibYAML decodes the UTF-8 buffer itself
+    yaml, loader, _ = _yaml()
+    data = yaml.load(Path(path_str).read_bytes(), Loader=loader) or {}
+    
+    if _json_faithful(data):
+        _write_json_cache(cache_path, {'source': source, 'data': data})
+    return data
+
+
+def _json_cache_path(path_str: str) -> Path:
+    """Location of the JSON cache for a config file (one per resolved path)."""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha1(path_str.encode('utf-8')).hexdigest()[:16]
+    return Path(cache_root) / 'py300chess' / f'config-{digest}.json'
+
+
+def _json_faithful(value: Any) -> bool:
+    """
+    Check that a parsed YAML value survives a JSON round trip unchanged.
+    
+    JSON only has string keys and no dates, sets or binary values; YAML data
+    using any of those is never cached.
+    """
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _json_faithful(item) for key, item in value.items())
+    if isinstance(value, list):
+        return all(_json_faithful(item) for item in value)
+    return value is None or isinstance(value, (str, int, float))
+
+
+def _write_json_cache(cache_path: Path, payload: dict):
+    """Atomically write the JSON cache, ignoring any failure."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        # Read-only cache directory: just parse the YAML next time
+        pass
+
+
+def clear_cache():
+    """Drop all cached YAML parse results."""
+    _load_raw.cache_clear()
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern strings in a parsed YAML value.
+    
+    Channel names, colors, log levels and similar short strings are compared
+    often and re-created on every reload; interning shares one object per
+    distinct value. Lists become tuples of interned strings.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_intern(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _intern(item) for key, item in value.items()}
+    return value
+
+
+def _raise_if_errors(errors: list):
+    """Raise a ValueError listing all validation errors, one per line."""
+    if errors:
+        raise ValueError("\n".join(errors))
+
+
+@dataclass(slots=True, frozen=True)
 class EEGConfig:
     """EEG system configuration."""
     sampling_rate: int = 250
     n_channels: int = 1
-    channel_names: list = field(default_factory=lambda: ["Cz"])
+    channel_names: tuple = ("Cz",)
     use_simulation: bool = True
     stream_name: str = "EEG_Stream"
+    
+    def __post_init__(self):
+        errors = []
+        if self.sampling_rate <= 0:
+            errors.append("EEG sampling rate must be positive")
+        if self.n_channels <= 0:
+            errors.append("Number of EEG channels must be positive")
+        if len(self.channel_names) != self.n_channels:
+            errors.append("Number of channel names must match n_channels")
+        _raise_if_errors(errors)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class P300Config:
     """P300 detection configuration."""
-    detection_window: list = field(default_factory=lambda: [250, 500])
-    baseline_window: list = field(default_factory=lambda: [-200, 0])
+    detection_window: tuple = (250, 500)
+    baseline_window: tuple = (-200, 0)
     epoch_length: int = 800
-    bandpass_filter: list = field(default_factory=lambda: [0.5, 30.0])
+    bandpass_filter: tuple = (0.5, 30.0)
     detection_threshold: float = 2.0
     min_confidence: float = 0.6
     notch_filter: Optional[int] = 50
+    
+    def __post_init__(self):
+        errors = []
+        if self.detection_window[0] >= self.detection_window[1]:
+            errors.append("P300 detection window start must be before end")
+        if self.baseline_window[0] >= self.baseline_window[1]:
+            errors.append("P300 baseline window start must be before end")
+        if not (0.0 <= self.min_confidence <= 1.0):
+            errors.append("P300 minimum confidence must be between 0.0 and 1.0")
+        _raise_if_errors(errors)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StimulusConfig:
     """Stimulus presentation configuration."""
     flash_duration: int = 100
     inter_flash_interval: int = 200
     selection_pause: int = 1000
     flash_repetitions: int = 3
-    flash_colors: dict = field(default_factory=lambda: {
+    # Read-only view of a private copy; left out of the hash since mappings
+    # are unhashable (equal configs still hash equal)
+    flash_colors: Mapping[str, str] = field(hash=False, default_factory=lambda: {
         "normal": "#8B4513",
         "highlight": "#FFD700", 
         "flash": "#FF0000",
         "selected": "#00FF00"
     })
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'flash_colors', MappingProxyType(dict(self.flash_colors)))
+        
+        errors = []
+        if self.flash_duration <= 0:
+            errors.append("Flash duration must be positive")
+        if self.inter_flash_interval <= 0:
+            errors.append("Inter-flash interval must be positive")
+        if self.flash_repetitions <= 0:
+            errors.append("Flash repetitions must be positive")
+        _raise_if_errors(errors)
+    
+    def __reduce__(self):
+        # mappingproxy can't be pickled or deep-copied: rebuild from plain values
+        return (self.__class__, tuple(_plain(getattr(self, f.name)) for f in fields(self)))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChessConfig:
     """Chess engine configuration."""
     engine_strength: int = 3
@@ -59,20 +226,38 @@ class ChessConfig:
     enable_en_passant: bool = True
     enable_promotion: bool = True
     starting_position: str = "startpos"
+    
+    def __post_init__(self):
+        errors = []
+        if not (1 <= self.engine_strength <= 10):
+            errors.append("Chess engine strength must be between 1 and 10")
+        if self.time_limit <= 0:
+            errors.append("Chess time limit must be positive")
+        _raise_if_errors(errors)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GUIConfig:
     """GUI configuration."""
-    window_size: list = field(default_factory=lambda: [800, 600])
+    window_size: tuple = (800, 600)
     board_size: int = 480
     piece_style: str = "default"
     show_confidence: bool = True
     display_update_rate: int = 30
     font_size: int = 12
+    
+    def __post_init__(self):
+        errors = []
+        if len(self.window_size) != 2:
+            errors.append("GUI window size must be [width, height]")
+        if any(size <= 0 for size in self.window_size):
+            errors.append("GUI window dimensions must be positive")
+        if self.board_size <= 0:
+            errors.append("Chess board size must be positive")
+        _raise_if_errors(errors)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeedbackConfig:
     """Feedback and monitoring configuration."""
     confidence_display_time: int = 500
@@ -81,7 +266,7 @@ class FeedbackConfig:
     enable_signal_plots: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulationConfig:
     """EEG simulation configuration."""
     noise_amplitude: float = 10.0
@@ -91,9 +276,19 @@ class SimulationConfig:
     p300_probability: float = 0.8
     add_artifacts: bool = True
     artifact_rate: float = 0.1
+    
+    def __post_init__(self):
+        errors = []
+        if self.noise_amplitude < 0:
+            errors.append("Simulation noise amplitude must be non-negative")
+        if self.p300_amplitude < 0:
+            errors.append("Simulation P300 amplitude must be non-negative")
+        if not (0.0 <= self.p300_probability <= 1.0):
+            errors.append("Simulation P300 probability must be between 0.0 and 1.0")
+        _raise_if_errors(errors)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecordingConfig:
     """Data recording configuration."""
     enable_recording: bool = False
@@ -104,9 +299,14 @@ class RecordingConfig:
     record_game_events: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
-    """Main configuration class containing all sub-configurations."""
+    """
+    Main configuration class containing all sub-configurations.
+    
+    Configuration objects are immutable; use update_config() to derive a
+    modified copy.
+    """
     eeg: EEGConfig = field(default_factory=EEGConfig)
     p300: P300Config = field(default_factory=P300Config)
     stimulus: StimulusConfig = field(default_factory=StimulusConfig)
@@ -117,6 +317,39 @@ class Config:
     recording: RecordingConfig = field(default_factory=RecordingConfig)
 
 
+# Section name -> config class, and the field names of each section in
+# declaration order (computed once at import)
+_SECTIONS = {
+    'eeg': EEGConfig,
+    'p300': P300Config,
+    'stimulus': StimulusConfig,
+    'chess': ChessConfig,
+    'gui': GUIConfig,
+    'feedback': FeedbackConfig,
+    'simulation': SimulationConfig,
+    'recording': RecordingConfig,
+}
+_FIELDS = {name: tuple(f.name for f in fields(cls)) for name, cls in _SECTIONS.items()}
+# Whitelist of accepted keys per section, for O(1) membership checks
+_FIELD_SETS = {name: frozenset(names) for name, names in _FIELDS.items()}
+
+
+def _to_bool(value: str) -> bool:
+    """Convert an environment variable string to a bool."""
+    return value.lower() == 'true'
+
+
+# (environment variable, section, key, converter)
+_ENV_OVERRIDES = (
+    ('PY300_SAMPLING_RATE', 'eeg', 'sampling_rate', int),
+    ('PY300_N_CHANNELS', 'eeg', 'n_channels', int),
+    ('PY300_USE_SIMULATION', 'eeg', 'use_simulation', _to_bool),
+    ('PY300_STREAM_NAME', 'eeg', 'stream_name', str),
+    ('PY300_DEBUG_MODE', 'feedback', 'debug_mode', _to_bool),
+    ('PY300_LOG_LEVEL', 'feedback', 'log_level', str),
+)
+
+
 class ConfigLoader:
     """Configuration loader with validation and environment variable support."""
     
@@ -135,7 +368,10 @@ class ConfigLoader:
             config_path = project_root / "config.yaml"
         
         self.config_path = Path(config_path)
+        self._resolved_path = str(self.config_path.resolve())
+        self._load_key = None
         self._config_data = None
+        self.logger = logging.getLogger(__name__)
         self._config = None
     
     def load(self) -> Config:
@@ -150,130 +386,89 @@ class ConfigLoader:
             yaml.YAMLError: If configuration file is invalid YAML.
             ValueError: If configuration validation fails.
         """
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-        
-        # Load YAML data
-        with open(self.config_path, 'r') as f:
-            self._config_data = yaml.safe_load(f)
+        return self._load(self._stat())
+    
+    def _stat(self) -> os.stat_result:
+        """Stat the configuration file, raising FileNotFoundError if it is missing."""
+        try:
+            return os.stat(self._resolved_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
+    
+    def _load(self, st: os.stat_result) -> Config:
+        """Load the configuration from the file state described by st."""
+        # The single stat() both checked existence and keys the parse cache
+        self._load_key = _file_key(self._resolved_path, st)
+        
+        # Load YAML data (cached until the file changes on disk)
+        raw = _load_raw(*self._load_key)
+        
+        # Environment overrides only set keys inside a section, so copying
+        # each section dict is enough to keep the cached parse untouched.
+        # deepcopy is deliberately avoided in the config path: it is slow on
+        # config trees and nothing below the section level is ever mutated.
+        self._config_data = {
+            name: section.copy() if isinstance(section, dict) else section
+            for name, section in raw.items()
+        }
         
         # Apply environment variable overrides
         self._apply_env_overrides()
         
-        # Create configuration objects
+        # Create (and validate) configuration objects
         self._config = self._create_config_objects()
         
-        # Validate configuration
-        self._validate_config()
-        
         return self._config
     
     def _apply_env_overrides(self):
         """Apply environment variable overrides to configuration."""
-        # Check for common environment variables
-        env_overrides = {
-            'PY300_SAMPLING_RATE': ('eeg', 'sampling_rate', int),
-            'PY300_N_CHANNELS': ('eeg', 'n_channels', int),
-            'PY300_USE_SIMULATION': ('eeg', 'use_simulation', lambda x: x.lower() == 'true'),
-            'PY300_STREAM_NAME': ('eeg', 'stream_name', str),
-            'PY300_DEBUG_MODE': ('feedback', 'debug_mode', lambda x: x.lower() == 'true'),
-            'PY300_LOG_LEVEL': ('feedback', 'log_level', str),
-        }
-        
-        for env_var, (section, key, converter) in env_overrides.items():
-            if env_var in os.environ:
-                value = converter(os.environ[env_var])
-                if section not in self._config_data:
-                    self._config_data[section] = {}
-                self._config_data[section][key] = value
+        environ = os.environ
+        for env_var, section, key, converter in _ENV_OVERRIDES:
+            raw = environ.get(env_var)
+            if raw is not None:
+                self._config_data.setdefault(section, {})[key] = converter(raw)
     
     def _create_config_objects(self) -> Config:
-        """Create configuration objects from loaded data."""
-        # Create individual config sections
-        eeg_config = EEGConfig(**self._config_data.get('eeg', {}))
-        p300_config = P300Config(**self._config_data.get('p300', {}))
-        stimulus_config = StimulusConfig(**self._config_data.get('stimulus', {}))
-        chess_config = ChessConfig(**self._config_data.get('chess', {}))
-        gui_config = GUIConfig(**self._config_data.get('gui', {}))
-        feedback_config = FeedbackConfig(**self._config_data.get('feedback', {}))
-        simulation_config = SimulationConfig(**self._config_data.get('simulation', {}))
-        recording_config = RecordingConfig(**self._config_data.get('recording', {}))
+        """
+        Create configuration objects from loaded data.
         
-        # Create main config object
-        return Config(
-            eeg=eeg_config,
-            p300=p300_config,
-            stimulus=stimulus_config,
-            chess=chess_config,
-            gui=gui_config,
-            feedback=feedback_config,
-            simulation=simulation_config,
-            recording=recording_config
-        )
-    
-    def _validate_config(self):
-        """Validate configuration values."""
+        Each section validates itself on construction; errors from all
+        sections are collected and reported together.
+        """
+        sections = {}
         errors = []
         
-        # Validate EEG settings
-        if self._config.eeg.sampling_rate <= 0:
-            errors.append("EEG sampling rate must be positive")
-        
-        if self._config.eeg.n_channels <= 0:
-            errors.append("Number of EEG channels must be positive")
-        
-        if len(self._config.eeg.channel_names) != self._config.eeg.n_channels:
-            errors.append("Number of channel names must match n_channels")
-        
-        # Validate P300 settings
-        if self._config.p300.detection_window[0] >= self._config.p300.detection_window[1]:
-            errors.append("P300 detection window start must be before end")
-        
-        if self._config.p300.baseline_window[0] >= self._config.p300.baseline_window[1]:
-            errors.append("P300 baseline window start must be before end")
-        
-        if not (0.0 <= self._config.p300.min_confidence <= 1.0):
-            errors.append("P300 minimum confidence must be between 0.0 and 1.0")
-        
-        # Validate stimulus settings
-        if self._config.stimulus.flash_duration <= 0:
-            errors.append("Flash duration must be positive")
-        
-        if self._config.stimulus.inter_flash_interval <= 0:
-            errors.append("Inter-flash interval must be positive")
-        
-        if self._config.stimulus.flash_repetitions <= 0:
-            errors.append("Flash repetitions must be positive")
-        
-        # Validate chess settings
-        if not (1 <= self._config.chess.engine_strength <= 10):
-            errors.append("Chess engine strength must be between 1 and 10")
-        
-        if self._config.chess.time_limit <= 0:
-            errors.append("Chess time limit must be positive")
-        
-        # Validate GUI settings
-        if len(self._config.gui.window_size) != 2:
-            errors.append("GUI window size must be [width, height]")
-        
-        if any(size <= 0 for size in self._config.gui.window_size):
-            errors.append("GUI window dimensions must be positive")
+        for name, cls in _SECTIONS.items():
+            try:
+                sections[name] = cls(**self._section(name))
+            except ValueError as e:
+                errors.extend(str(e).splitlines())
         
-        if self._config.gui.board_size <= 0:
-            errors.append("Chess board size must be positive")
+        if errors:
+            raise ValueError("Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors))
         
-        # Validate simulation settings
-        if self._config.simulation.noise_amplitude < 0:
-            errors.append("Simulation noise amplitude must be non-negative")
+        return Config(**sections)
+    
+    def _section(self, name: str) -> dict:
+        """
+        Get a config section ready to pass to its dataclass.
         
-        if self._config.simulation.p300_amplitude < 0:
-            errors.append("Simulation P300 amplitude must be non-negative")
+        YAML lists are converted to tuples and strings interned. Keys that are
+        not fields of the section (e.g. from a newer config file) are dropped
+        instead of failing the whole load.
+        """
+        allowed = _FIELD_SETS[name]
+        data = self._config_data.get(name, {})
         
-        if not (0.0 <= self._config.simulation.p300_probability <= 1.0):
-            errors.append("Simulation P300 probability must be between 0.0 and 1.0")
+        unknown = data.keys() - allowed
+        if unknown:
+            self.logger.debug(f"Ignoring unknown '{name}' config keys: {', '.join(sorted(unknown))}")
         
-        if errors:
-            raise ValueError("Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors))
+        return {
+            key: _intern(value)
+            for key, value in data.items()
+            if key in allowed
+        }
     
     def save(self, config: Config, path: Optional[Union[str, Path]] = None):
         """
@@ -292,80 +487,55 @@ class ConfigLoader:
         config_dict = self._config_to_dict(config)
         
         # Save to YAML file
-        with open(path, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        yaml, _, dumper = _yaml()
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.dump(
+                config_dict, f, Dumper=dumper,
+                default_flow_style=False, sort_keys=False,
+                width=10000, allow_unicode=True,
+            )
     
     def _config_to_dict(self, config: Config) -> dict:
         """Convert configuration object to dictionary."""
         return {
-            'eeg': {
-                'sampling_rate': config.eeg.sampling_rate,
-                'n_channels': config.eeg.n_channels,
-                'channel_names': config.eeg.channel_names,
-                'use_simulation': config.eeg.use_simulation,
-                'stream_name': config.eeg.stream_name,
-            },
-            'p300': {
-                'detection_window': config.p300.detection_window,
-                'baseline_window': config.p300.baseline_window,
-                'epoch_length': config.p300.epoch_length,
-                'bandpass_filter': config.p300.bandpass_filter,
-                'detection_threshold': config.p300.detection_threshold,
-                'min_confidence': config.p300.min_confidence,
-                'notch_filter': config.p300.notch_filter,
-            },
-            'stimulus': {
-                'flash_duration': config.stimulus.flash_duration,
-                'inter_flash_interval': config.stimulus.inter_flash_interval,
-                'selection_pause': config.stimulus.selection_pause,
-                'flash_repetitions': config.stimulus.flash_repetitions,
-                'flash_colors': config.stimulus.flash_colors,
-            },
-            'chess': {
-                'engine_strength': config.chess.engine_strength,
-                'time_limit': config.chess.time_limit,
-                'enable_castling': config.chess.enable_castling,
-                'enable_en_passant': config.chess.enable_en_passant,
-                'enable_promotion': config.chess.enable_promotion,
-                'starting_position': config.chess.starting_position,
-            },
-            'gui': {
-                'window_size': config.gui.window_size,
-                'board_size': config.gui.board_size,
-                'piece_style': config.gui.piece_style,
-                'show_confidence': config.gui.show_confidence,
-                'display_update_rate': config.gui.display_update_rate,
-                'font_size': config.gui.font_size,
-            },
-            'feedback': {
-                'confidence_display_time': config.feedback.confidence_display_time,
-                'debug_mode': config.feedback.debug_mode,
-                'log_level': config.feedback.log_level,
-                'enable_signal_plots': config.feedback.enable_signal_plots,
-            },
-            'simulation': {
-                'noise_amplitude': config.simulation.noise_amplitude,
-                'p300_amplitude': config.simulation.p300_amplitude,
-                'p300_latency': config.simulation.p300_latency,
-                'p300_width': config.simulation.p300_width,
-                'p300_probability': config.simulation.p300_probability,
-                'add_artifacts': config.simulation.add_artifacts,
-                'artifact_rate': config.simulation.artifact_rate,
-            },
-            'recording': {
-                'enable_recording': config.recording.enable_recording,
-                'data_directory': config.recording.data_directory,
-                'file_format': config.recording.file_format,
-                'record_raw_eeg': config.recording.record_raw_eeg,
-                'record_epochs': config.recording.record_epochs,
-                'record_game_events': config.recording.record_game_events,
-            }
+            section: {name: _plain(getattr(getattr(config, section), name)) for name in names}
+            for section, names in _FIELDS.items()
         }
 
 
+def _plain(value: Any) -> Any:
+    """Convert read-only mappings back to dicts (YAML can't represent mappingproxy)."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    return value
+
+
+def update_config(config: Config, section: str, **changes) -> Config:
+    """
+    Return a copy of a configuration with some fields of one section replaced.
+    
+    Args:
+        config: Configuration to copy.
+        section: Name of the section to modify (e.g. 'eeg').
+        **changes: Field values to replace in that section.
+        
+    Returns:
+        Config: New configuration object.
+    """
+    return replace(config, **{section: replace(getattr(config, section), **changes)})
+
+
 # Global configuration instance
 _config_instance = None
 
+# (resolved path, st_mtime_ns, st_size) of the file _config_instance was loaded from
+_last_load_key = None
+
+
+def _file_key(path_str: str, st: os.stat_result) -> tuple:
+    """Identify the on-disk state of a configuration file."""
+    return (path_str, st.st_mtime_ns, st.st_size)
+
 
 def get_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     """
@@ -377,11 +547,12 @@ def get_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     Returns:
         Config: Global configuration object.
     """
-    global _config_instance
+    global _config_instance, _last_load_key
     
     if _config_instance is None:
         loader = ConfigLoader(config_path)
         _config_instance = loader.load()
+        _last_load_key = loader._load_key
     
     return _config_instance
 
@@ -390,28 +561,57 @@ def reload_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     """
     Reload the global configuration.
     
+    If the file has not changed since the global configuration was loaded,
+    the existing instance is returned. Call invalidate_config() first to
+    force a full reload (e.g. after changing environment overrides).
+    
     Args:
         config_path: Path to configuration file.
         
     Returns:
         Config: Reloaded configuration object.
     """
-    global _config_instance
+    global _config_instance, _last_load_key
     
     loader = ConfigLoader(config_path)
-    _config_instance = loader.load()
+    st = loader._stat()
+    if _config_instance is not None and _file_key(loader._resolved_path, st) == _last_load_key:
+        return _config_instance
+    
+    _config_instance = loader._load(st)
+    _last_load_key = loader._load_key
     
     return _config_instance
 
 
-if __name__ == "__main__":
-    # Test configuration loading
+def invalidate_config():
+    """Forget the global configuration so the next access reloads it."""
+    global _config_instance, _last_load_key
+    
+    _config_instance = None
+    _last_load_key = None
+
+
+def _demo(config_path: Optional[Union[str, Path]] = None):
+    """Load the configuration and print a short summary."""
     try:
-        config = get_config()
+        config = get_config(config_path)
         print("Configuration loaded successfully!")
         print(f"EEG sampling rate: {config.eeg.sampling_rate} Hz")
         print(f"Number of channels: {config.eeg.n_channels}")
         print(f"P300 detection window: {config.p300.detection_window} ms")
         print(f"Flash duration: {config.stimulus.flash_duration} ms")
     except Exception as e:
-        print(f"Error loading configuration: {e}")
\ No newline at end of file
+        print(f"Error loading configuration: {e}")
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    # Parse arguments first so --help exits without touching the config file
+    parser = argparse.ArgumentParser(description="Load and summarize the py300chess configuration")
+    parser.add_argument('config', nargs='?', default=None,
+                        help='Configuration file path (default: config.yaml)')
+    args = parser.parse_args()
+    
+    _demo(args.config)
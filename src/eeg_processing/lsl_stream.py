@@ -51,6 +51,7 @@ class RealEEGStreamer:
         # Threading
         self.streaming_thread = None
         self.is_running = False
+        self.ready = threading.Event()  # Set once streaming has started
         
         # Data processing
         self.data_buffer = []
@@ -61,8 +62,11 @@ class RealEEGStreamer:
         Start real EEG streaming.
         
         Args:
-            processing_callback: Optional function to process data in real-time
-                                 callback(data, timestamps) -> processed_data
+            processing_callback: Optional function to process data in real-time,
+                                 called once per chunk (samples x channels)
+                                 callback(data, timestamps) -> processed_data.
+                                 data is a view into the reused pull buffer and
+                                 is only valid during the call: copy it to keep it.
         """
         if self.is_running:
             self.logger.warning("Real EEG streaming already running")
@@ -100,6 +104,7 @@ class RealEEGStreamer:
             return
         
         self.is_running = False
+        self.ready.clear()
         
         # Wait for streaming thread
         if self.streaming_thread:
@@ -127,14 +132,36 @@ class RealEEGStreamer:
             if not streams:
                 raise RuntimeError(f"No EEG device found. Checked for name='{self.stream_name}' and type='EEG'")
         
-        # Connect to the first available stream
-        self.input_inlet = lsl.StreamInlet(streams[0])
+        # Pull ~40ms chunks
+        self._max_chunk = max(1, int(streams[0].nominal_srate() * 0.04))
+        
+        # Connect to the first available stream; liblsl maps timestamps onto
+        # the local clock and dejitters them, so they can be forwarded as-is.
+        # Buffer at most 2s: older data is useless for real-time forwarding.
+        self.input_inlet = lsl.StreamInlet(
+            streams[0], max_buflen=2, max_chunklen=self._max_chunk,
+            processing_flags=lsl.proc_ALL
+        )
         
         # Get stream info
         info = self.input_inlet.info()
         self.hardware_rate = info.nominal_srate()
         self.hardware_channels = info.channel_count()
         
+        # liblsl writes float32 streams straight into the pull buffer
+        self._chunk_buf = None
+        if info.channel_format() == lsl.cf_float32:
+            self._chunk_buf = np.empty((self._max_chunk, self.hardware_channels), dtype=np.float32)
+        
+        # The hardware layout is fixed: settle channel adaptation once here.
+        # Padding reuses one zeroed buffer whose extra channels stay zero.
+        self._pad_buf = None
+        if self.hardware_channels > self.n_channels:
+            self.logger.info(f"Selecting first {self.n_channels} of {self.hardware_channels} channels")
+        elif self.hardware_channels < self.n_channels:
+            self.logger.info(f"Padding {self.hardware_channels} channels to {self.n_channels}")
+            self._pad_buf = np.zeros((self._max_chunk, self.n_channels), dtype=np.float32)
+        
         self.logger.info(f"✅ Connected to EEG device:")
         self.logger.info(f"  Name: {info.name()}")
         self.logger.info(f"  Channels: {self.hardware_channels}")
@@ -166,7 +193,7 @@ class RealEEGStreamer:
         processing.append_child_value("source", f"Hardware device: {self.stream_name}")
         processing.append_child_value("software", "py300chess real EEG streamer")
         
-        self.output_outlet = lsl.StreamOutlet(output_info)
+        self.output_outlet = lsl.StreamOutlet(output_info, max_buffered=2)
         self.logger.info("Created ProcessedEEG LSL outlet")
     
     def _streaming_loop(self):
@@ -175,39 +202,52 @@ class RealEEGStreamer:
         
         sample_count = 0
         
+        # Config is immutable: read it once instead of on every chunk
+        debug_mode = self.config.feedback.debug_mode
+        status_interval = max(1, int(self.hardware_rate * 10))  # Every 10 seconds
+        self.ready.set()
+        
         try:
             while self.is_running:
-                # Pull sample from hardware
+                # Pull a chunk from hardware
                 try:
-                    sample, timestamp = self.input_inlet.pull_sample(timeout=1.0)
+                    data, timestamps = self.input_inlet.pull_chunk(
+                        timeout=1.0, max_samples=self._max_chunk, dest_obj=self._chunk_buf
+                    )
                     
-                    if sample is None:
+                    n_samples = len(timestamps)
+                    if n_samples == 0:
                         self.logger.warning("No data received from EEG device")
                         continue
                     
-                    sample_count += 1
+                    if self._chunk_buf is not None:
+                        data = self._chunk_buf[:n_samples]
+                    else:
+                        data = np.asarray(data, dtype=np.float32)
+                    
+                    previous_count = sample_count
+                    sample_count += n_samples
                     
                     # Apply processing if callback provided
                     if self.processing_callback:
                         try:
-                            processed_sample = self.processing_callback(sample, timestamp)
-                            if processed_sample is not None:
-                                sample = processed_sample
+                            processed_data = self.processing_callback(data, timestamps)
+                            if processed_data is not None:
+                                data = processed_data
                         except Exception as e:
                             self.logger.warning(f"Processing callback error: {e}")
                     
                     # Forward to output stream
                     if self.output_outlet:
-                        # Ensure sample has correct number of channels
-                        if len(sample) != self.n_channels:
+                        # Ensure samples have correct number of channels
+                        if np.shape(data)[1] != self.n_channels:
                             # Handle channel count mismatch
-                            sample = self._adapt_channels(sample)
+                            data = self._adapt_channels(data)
                         
-                        self.output_outlet.push_sample(sample, timestamp)
+                        self.output_outlet.push_chunk(data, timestamps)
                     
                     # Periodic status
-                    if (self.config.feedback.debug_mode and 
-                        sample_count % (self.hardware_rate * 10) == 0):  # Every 10 seconds
+                    if debug_mode and sample_count // status_interval > previous_count // status_interval:
                         self.logger.info(f"📊 Processed {sample_count} samples from hardware")
                 
                 except Exception as e:
@@ -219,31 +259,34 @@ class RealEEGStreamer:
         finally:
             self.logger.info("Real EEG streaming loop ended")
     
-    def _adapt_channels(self, sample: List[float]) -> List[float]:
+    def _adapt_channels(self, data: np.ndarray) -> np.ndarray:
         """
         Adapt hardware channels to match configuration.
         
         Args:
-            sample: Raw sample from hardware
+            data: Raw chunk from hardware (samples x channels)
             
         Returns:
-            Adapted sample with correct channel count
+            Adapted chunk with correct channel count
         """
-        hardware_channels = len(sample)
+        hardware_channels = np.shape(data)[1]
         target_channels = self.n_channels
         
         if hardware_channels == target_channels:
-            return sample
+            return data
         elif hardware_channels > target_channels:
-            # Select first N channels
-            self.logger.debug(f"Selecting first {target_channels} of {hardware_channels} channels")
-            return sample[:target_channels]
+            # Select first N channels (a view, no copy)
+            return np.asarray(data)[:, :target_channels]
+        elif (self._pad_buf is not None and hardware_channels == self.hardware_channels
+              and len(data) <= len(self._pad_buf)):
+            # Pad with zeros into the preallocated buffer
+            adapted = self._pad_buf[:len(data)]
+            adapted[:, :hardware_channels] = data
+            return adapted
         else:
-            # Pad with zeros or duplicate channels
-            self.logger.debug(f"Padding {hardware_channels} channels to {target_channels}")
-            adapted = list(sample)
-            while len(adapted) < target_channels:
-                adapted.append(0.0)  # Pad with zeros
+            # Pad with zeros
+            adapted = np.zeros((len(data), target_channels), dtype=np.float32)
+            adapted[:, :hardware_channels] = data
             return adapted
     
     def get_status(self) -> Dict:
@@ -350,40 +393,40 @@ class EEGDeviceManager:
 
 
 # Built-in processing functions
-def basic_preprocessing(sample: List[float], timestamp: float) -> List[float]:
+def basic_preprocessing(chunk: np.ndarray, timestamps: List[float]) -> np.ndarray:
     """
     Basic EEG preprocessing.
     
     Args:
-        sample: Raw EEG sample
-        timestamp: Sample timestamp
+        chunk: Raw EEG chunk (samples x channels)
+        timestamps: Sample timestamps
         
     Returns:
-        Processed sample
+        Processed chunk
     """
-    # Convert to numpy for processing
-    data = np.array(sample)
+    # View as numpy for processing (no copy when already an array)
+    data = np.asarray(chunk)
     
     # Simple bandpass filtering (placeholder - would use proper filtering)
     # For now, just return the data as-is
     
-    return data.tolist()
+    return data
 
 
-def notch_filter_60hz(sample: List[float], timestamp: float) -> List[float]:
+def notch_filter_60hz(chunk: np.ndarray, timestamps: List[float]) -> np.ndarray:
     """
     Apply 60Hz notch filter to remove line noise.
     
     Args:
-        sample: Raw EEG sample
-        timestamp: Sample timestamp
+        chunk: Raw EEG chunk (samples x channels)
+        timestamps: Sample timestamps
         
     Returns:
-        Filtered sample
+        Filtered chunk
     """
     # TODO: Implement proper notch filtering
     # For now, just return the data as-is
-    return sample
+    return chunk
 
 
 # Standalone execution
@@ -395,7 +438,7 @@ if __name__ == "__main__":
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
     sys.path.insert(0, project_root)
     
-    from config.config_loader import get_config
+    from config.config_loader import get_config, update_config
     
     # Setup logging
     logging.basicConfig(
@@ -446,8 +489,8 @@ if __name__ == "__main__":
         
         # Load config and start streaming
         config = get_config()
-        config.eeg.stream_name = chosen_device['name']
-        config.feedback.debug_mode = True
+        config = update_config(config, 'eeg', stream_name=chosen_device['name'])
+        config = update_config(config, 'feedback', debug_mode=True)
         
         streamer = RealEEGStreamer(config)
         
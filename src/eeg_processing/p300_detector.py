@@ -54,24 +54,46 @@ class P300Detector:
         ]
         self.epoch_samples = int(self.epoch_length * self.sampling_rate / 1000)
         
+        # Epochs are always epoch_samples long with the stimulus at the
+        # middle, so the window slices are fixed: work them out once
+        stimulus_index = self.epoch_samples // 2
+        self._baseline_slice = self._epoch_slice(stimulus_index, self.baseline_samples)
+        self._detection_slice = self._epoch_slice(stimulus_index, self.detection_samples)
+        if self._detection_slice is None:
+            self.logger.warning("Detection window does not fit in the epoch; confidence will be 0")
+        
         # LSL components
         self.eeg_inlet = None
         self.flash_inlet = None
         self.response_outlet = None
         
-        # Data buffers
-        self.eeg_buffer = deque(maxlen=self.sampling_rate * 5)  # 5 seconds
+        # EEG buffer as parallel arrays (samples, timestamps). New samples are
+        # appended linearly; when the arrays fill up, the newest buffer_samples
+        # are moved back to the front, so the valid region [:_buffer_count]
+        # is always contiguous and time-ordered (searchsorted-able).
+        self.buffer_samples = self.sampling_rate * 5  # 5 seconds
+        buffer_capacity = self.buffer_samples * 2
+        self._eeg_data = np.empty((buffer_capacity, self.n_channels), dtype=np.float32)
+        self._eeg_times = np.empty(buffer_capacity, dtype=np.float64)
+        self._buffer_count = 0
+        self._max_chunk = max(1, self.sampling_rate // 10)  # Samples per pull (100 ms)
+        self._chunk_buf = None  # liblsl pulls float32 chunks straight into this
+        self._pad_buf = None  # Zero-padded chunks when the stream has too few channels
+        
         self.flash_events = deque(maxlen=100)  # Recent flash events
         
         # Threading
         self.processing_thread = None
         self.is_running = False
+        self.ready = threading.Event()  # Set once processing has started
         
         # P300 template (will be computed from config)
         self.p300_template = self._create_p300_template()
+        self._matched_templates = {}  # Window length -> centered unit template
         
-        # Filtering
+        # Filtering (causal, applied as samples arrive; state carries over)
         self.bandpass_filter = self._design_bandpass_filter()
+        self._filter_state = None
         
     def start(self):
         """Start P300 detection."""
@@ -105,6 +127,7 @@ class P300Detector:
             return
         
         self.is_running = False
+        self.ready.clear()
         
         if self.processing_thread:
             self.processing_thread.join(timeout=2.0)
@@ -135,7 +158,28 @@ class P300Detector:
             if not eeg_stream:
                 raise RuntimeError("No EEG stream found (SimulatedEEG or ProcessedEEG)")
             
-            self.eeg_inlet = lsl.StreamInlet(eeg_stream)
+            # Clock sync, dejitter and monotonize in liblsl: buffer timestamps
+            # are on the local clock and sorted, as the epoch search expects.
+            # The inlet only bridges processing stalls, so 2s of backlog is plenty.
+            self.eeg_inlet = lsl.StreamInlet(
+                eeg_stream, max_buflen=2, max_chunklen=self._max_chunk,
+                processing_flags=lsl.proc_ALL
+            )
+            self._filter_state = None  # New stream: restart the filter from its first block
+            stream_channels = eeg_stream.channel_count()
+            self._chunk_buf = None
+            if eeg_stream.channel_format() == lsl.cf_float32:
+                self._chunk_buf = np.empty((self._max_chunk, stream_channels), dtype=np.float32)
+            
+            # The stream layout is fixed: settle channel adaptation once here.
+            # Padding reuses one zeroed buffer whose extra channels stay zero.
+            self._pad_buf = None
+            if stream_channels > self.n_channels:
+                self.logger.info(f"Using first {self.n_channels} of {stream_channels} EEG channels")
+            elif stream_channels < self.n_channels:
+                self.logger.warning(f"⚠️ EEG stream has {stream_channels} channels, padding to {self.n_channels}")
+                self._pad_buf = np.zeros((self._max_chunk, self.n_channels), dtype=np.float32)
+            
             self.logger.info(f"✅ Connected to EEG stream: {eeg_stream.name()}")
             
         except Exception as e:
@@ -153,7 +197,8 @@ class P300Detector:
                     break
             
             if flash_stream:
-                self.flash_inlet = lsl.StreamInlet(flash_stream)
+                # Irregular markers: only map onto the local clock (no dejitter)
+                self.flash_inlet = lsl.StreamInlet(flash_stream, processing_flags=lsl.proc_clocksync)
                 self.logger.info("✅ Connected to ChessFlash stream")
             else:
                 self.logger.warning("⚠️ No ChessFlash stream found (GUI not running)")
@@ -179,10 +224,11 @@ class P300Detector:
         
         last_status_time = time.time()
         processed_epochs = 0
+        self.ready.set()
         
         try:
             while self.is_running:
-                # Pull new EEG data
+                # Pull new EEG data (waits briefly for it, pacing the loop)
                 self._update_eeg_buffer()
                 
                 # Check for new flash events
@@ -196,9 +242,6 @@ class P300Detector:
                 if time.time() - last_status_time > 10.0:
                     self.logger.info(f"📊 P300 Detector: {processed_epochs} epochs processed")
                     last_status_time = time.time()
-                
-                # Small delay to prevent busy waiting
-                time.sleep(0.01)
         
         except Exception as e:
             self.logger.error(f"P300 processing error: {e}")
@@ -208,146 +251,244 @@ class P300Detector:
     def _update_eeg_buffer(self):
         """Update EEG data buffer with new samples."""
         if not self.eeg_inlet:
+            time.sleep(0.01)  # Nothing to wait on
             return
         
-        # Pull available samples (non-blocking)
+        # Pull available samples in chunks. The first pull waits up to 5 ms
+        # inside liblsl, which paces the processing loop on data arrival;
+        # the rest only drain what is already buffered
+        timeout = 0.005
         while True:
             try:
-                sample, timestamp = self.eeg_inlet.pull_sample(timeout=0.0)
-                if sample is None:
-                    break
-                
-                # Add to buffer with timestamp
-                self.eeg_buffer.append((sample, timestamp))
-                
+                samples, timestamps = self.eeg_inlet.pull_chunk(
+                    timeout=timeout, max_samples=self._max_chunk, dest_obj=self._chunk_buf
+                )
+                timeout = 0.0
             except Exception as e:
                 self.logger.warning(f"EEG data pull error: {e}")
+                time.sleep(0.01)  # Don't spin on a failing inlet
                 break
+            
+            n_pulled = len(timestamps)
+            if n_pulled:
+                # With a destination buffer, samples land in it instead of a list
+                if self._chunk_buf is not None:
+                    samples = self._chunk_buf[:n_pulled]
+                else:
+                    samples = np.asarray(samples, dtype=np.float32)
+                
+                try:
+                    self._append_eeg(self._adapt_channels(samples), np.asarray(timestamps))
+                except Exception as e:
+                    self.logger.warning(f"EEG buffer update error: {e}")
+                    break
+            
+            if len(timestamps) < self._max_chunk:
+                break
+    
+    def _adapt_channels(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Adapt stream channels to match configuration.
+        
+        Args:
+            samples: EEG chunk from the stream (samples x channels)
+            
+        Returns:
+            Chunk with exactly n_channels channels
+        """
+        stream_channels = samples.shape[1]
+        
+        if stream_channels >= self.n_channels:
+            # Select first N channels (a view, no copy)
+            return samples[:, :self.n_channels]
+        elif self._pad_buf is not None and len(samples) <= len(self._pad_buf):
+            # Pad with zeros into the preallocated buffer
+            adapted = self._pad_buf[:len(samples)]
+        else:
+            # Pad with zeros
+            adapted = np.zeros((len(samples), self.n_channels), dtype=np.float32)
+        
+        adapted[:, :stream_channels] = samples
+        adapted[:, stream_channels:] = 0.0
+        return adapted
+    
+    def _append_eeg(self, samples: np.ndarray, timestamps: np.ndarray):
+        """
+        Bandpass-filter a block of samples and append it to the EEG buffer.
+        
+        Args:
+            samples: EEG samples (samples x channels)
+            timestamps: LSL timestamp of each sample
+            
+        Raises:
+            ValueError: If the block does not have n_channels channels
+        """
+        if samples.shape[1] != self.n_channels:
+            raise ValueError(f"Expected {self.n_channels} EEG channels, got {samples.shape[1]}")
+        
+        if self.bandpass_filter is not None:
+            if self._filter_state is not None and self._filter_state.shape[2] != samples.shape[1]:
+                self.logger.warning("EEG channel count changed, restarting bandpass filter")
+                self._filter_state = None
+            if self._filter_state is None:
+                # Start from steady state at the first sample to avoid a step transient
+                zi = signal.sosfilt_zi(self.bandpass_filter)
+                self._filter_state = (zi[:, :, np.newaxis] * samples[0]).astype(np.float32)
+            samples = np.asarray(samples, dtype=np.float32)
+            samples, self._filter_state = signal.sosfilt(
+                self.bandpass_filter, samples, axis=0, zi=self._filter_state
+            )
+        
+        n_new = len(timestamps)
+        count = self._buffer_count
+        
+        if n_new >= self.buffer_samples:
+            # Block alone fills the buffer: keep only its newest samples
+            samples = samples[-self.buffer_samples:]
+            timestamps = timestamps[-self.buffer_samples:]
+            n_new = self.buffer_samples
+            count = 0
+        elif count + n_new > len(self._eeg_times):
+            # Out of room: move the samples still within the window to the front
+            keep = self.buffer_samples - n_new
+            self._eeg_data[:keep] = self._eeg_data[count - keep:count]
+            self._eeg_times[:keep] = self._eeg_times[count - keep:count]
+            count = keep
+        
+        self._eeg_data[count:count + n_new] = samples
+        self._eeg_times[count:count + n_new] = timestamps
+        self._buffer_count = count + n_new
     
     def _check_flash_events(self):
         """Check for new flash events and queue epochs."""
         if not self.flash_inlet:
             return
         
-        while True:
-            try:
-                marker, timestamp = self.flash_inlet.pull_sample(timeout=0.0)
-                if marker is None:
-                    break
+        try:
+            markers, timestamps = self.flash_inlet.pull_chunk(timeout=0.0)
+        except Exception as e:
+            self.logger.warning(f"Flash event error: {e}")
+            return
+        
+        for marker, timestamp in zip(markers, timestamps):
+            # Parse flash marker: "square_flash|square=e4"
+            flash_info = self._parse_flash_marker(marker[0])
+            if flash_info:
+                flash_info['timestamp'] = timestamp
+                self.flash_events.append(flash_info)
                 
-                # Parse flash marker: "square_flash|square=e4"
-                flash_info = self._parse_flash_marker(marker[0])
-                if flash_info:
-                    flash_info['timestamp'] = timestamp
-                    self.flash_events.append(flash_info)
-                    
-                    self.logger.debug(f"Flash event: {flash_info['square']} at {timestamp:.3f}s")
-            
-            except Exception as e:
-                self.logger.warning(f"Flash event error: {e}")
-                break
+                # Lazy formatting: the message is only built if debug is enabled
+                self.logger.debug("Flash event: %s at %.3fs", flash_info['square'], timestamp)
     
     def _process_pending_epochs(self) -> int:
         """Process flash events that have enough data available."""
         processed_count = 0
-        current_time = time.time()
-        
-        # Process events that have enough post-stimulus data
-        events_to_remove = []
-        
-        for i, flash_event in enumerate(self.flash_events):
-            stimulus_time = flash_event['timestamp']
+        if self._buffer_count == 0 or not self.flash_events:
+            return 0
+        
+        # Flash and EEG timestamps are both LSL clock times, so compare the
+        # stimulus against the newest EEG sample rather than the wall clock
+        latest_eeg_time = self._eeg_times[self._buffer_count - 1]
+        half_epoch = self.epoch_length / 2000.0  # Half epoch around stimulus
+        
+        # Flash events arrive in time order, so the ones with enough
+        # post-stimulus data form a prefix of the queue
+        stimulus_times = np.fromiter(
+            (event['timestamp'] for event in self.flash_events),
+            dtype=np.float64, count=len(self.flash_events)
+        )
+        n_ready = int(np.searchsorted(stimulus_times, latest_eeg_time - half_epoch, side='right'))
+        if n_ready == 0:
+            return 0
+        
+        # Locate every ready epoch in the buffer with one binary search per bound
+        ready_times = stimulus_times[:n_ready]
+        timestamps = self._eeg_times[:self._buffer_count]
+        start_indices = np.searchsorted(timestamps, ready_times - half_epoch, side='left')
+        end_indices = np.searchsorted(timestamps, ready_times + half_epoch, side='right')
+        
+        # Epochs are epoch_samples long from their first sample: leave events
+        # whose epoch tail hasn't arrived yet for the next pass
+        n_ready = int(np.searchsorted(start_indices + self.epoch_samples, self._buffer_count, side='right'))
+        if n_ready == 0:
+            return 0
+        start_indices = start_indices[:n_ready]
+        
+        # Need at least 80% of samples inside the window (gaps, dropped data)
+        n_samples = end_indices[:n_ready] - start_indices
+        complete = n_samples >= self.epoch_samples * 0.8
+        ready_events = [self.flash_events.popleft() for _ in range(n_ready)]
+        
+        for n, is_complete in zip(n_samples, complete):
+            if not is_complete:
+                self.logger.warning(f"Insufficient data for epoch: {n}/{self.epoch_samples}")
+        
+        # Extract all complete epochs in one go and score them together
+        epochs = self._extract_epochs(start_indices[complete])
+        flash_events = [event for event, is_complete in zip(ready_events, complete) if is_complete]
+        confidences = self._detect_p300(epochs)
+        
+        for flash_event, confidence in zip(flash_events, confidences.tolist()):
+            # Send response if above threshold
+            if confidence >= self.min_confidence:
+                self._send_p300_response(flash_event['square'], confidence)
+                self.logger.info(f"🧠 P300 detected: {flash_event['square']} (confidence: {confidence:.2f})")
+            else:
+                self.logger.debug("Low confidence: %s (%.2f)", flash_event['square'], confidence)
             
-            # Check if we have enough data after stimulus
-            required_duration = self.epoch_length / 1000.0  # Convert to seconds
-            if current_time - stimulus_time >= required_duration:
-                
-                # Extract epoch and detect P300
-                epoch_data = self._extract_epoch(stimulus_time)
-                if epoch_data is not None:
-                    confidence = self._detect_p300(epoch_data)
-                    
-                    # Send response if above threshold
-                    if confidence >= self.min_confidence:
-                        self._send_p300_response(flash_event['square'], confidence)
-                        self.logger.info(f"🧠 P300 detected: {flash_event['square']} (confidence: {confidence:.2f})")
-                    else:
-                        self.logger.debug(f"Low confidence: {flash_event['square']} ({confidence:.2f})")
-                    
-                    processed_count += 1
-                
-                events_to_remove.append(i)
-        
-        # Remove processed events
-        for i in reversed(events_to_remove):
-            del self.flash_events[i]
+            processed_count += 1
         
         return processed_count
     
-    def _extract_epoch(self, stimulus_time: float) -> Optional[np.ndarray]:
-        """Extract EEG epoch around stimulus time."""
-        if len(self.eeg_buffer) < self.epoch_samples:
-            return None
-        
-        # Find samples within epoch window
-        epoch_start = stimulus_time - (self.epoch_length / 2000.0)  # Half epoch before
-        epoch_end = stimulus_time + (self.epoch_length / 2000.0)    # Half epoch after
-        
-        epoch_samples = []
-        for sample, timestamp in self.eeg_buffer:
-            if epoch_start <= timestamp <= epoch_end:
-                epoch_samples.append(sample)
-        
-        if len(epoch_samples) < self.epoch_samples * 0.8:  # Need at least 80% of samples
-            self.logger.warning(f"Insufficient data for epoch: {len(epoch_samples)}/{self.epoch_samples}")
-            return None
-        
-        # Convert to numpy array
-        epoch_data = np.array(epoch_samples)
-        
-        # Apply bandpass filtering
-        if self.bandpass_filter:
-            for ch in range(epoch_data.shape[1]):
-                epoch_data[:, ch] = signal.sosfiltfilt(self.bandpass_filter, epoch_data[:, ch])
+    def _extract_epochs(self, start_indices: np.ndarray) -> np.ndarray:
+        """
+        Extract EEG epochs from the (already filtered) buffer.
         
-        return epoch_data
+        Args:
+            start_indices: Buffer index of the first sample of each epoch
+            
+        Returns:
+            Epoch data (epochs x samples x channels)
+        """
+        # Strided (zero-copy) view of every epoch-length window in the buffer;
+        # the window axis comes last, so windows are (start, channel, sample).
+        # Indexing it gathers all epochs in one float32 copy
+        windows = np.lib.stride_tricks.sliding_window_view(
+            self._eeg_data[:self._buffer_count], self.epoch_samples, axis=0
+        )
+        return windows[start_indices].transpose(0, 2, 1)
     
-    def _detect_p300(self, epoch_data: np.ndarray) -> float:
+    def _detect_p300(self, epochs: np.ndarray) -> np.ndarray:
         """
-        Detect P300 in epoch data and return confidence score.
+        Detect P300 in a batch of epochs and return their confidence scores.
         
         Args:
-            epoch_data: EEG epoch (samples x channels)
+            epochs: EEG epochs (epochs x samples x channels)
             
         Returns:
-            Confidence score (0.0 to 1.0)
+            Confidence score (0.0 to 1.0) of each epoch
         """
-        # Apply baseline correction
-        baseline_end = len(epoch_data) // 2  # Stimulus at middle
-        baseline_start = baseline_end + self.baseline_samples[0]
-        baseline_end_idx = baseline_end + self.baseline_samples[1]
-        
-        if baseline_start >= 0 and baseline_end_idx <= len(epoch_data):
-            baseline_mean = np.mean(epoch_data[baseline_start:baseline_end_idx, :], axis=0)
-            epoch_data = epoch_data - baseline_mean
-        
         # Extract P300 detection window
-        detection_start = len(epoch_data) // 2 + self.detection_samples[0]
-        detection_end = len(epoch_data) // 2 + self.detection_samples[1]
+        if self._detection_slice is None:
+            return np.zeros(len(epochs))
         
-        if detection_start < 0 or detection_end > len(epoch_data):
-            return 0.0
-        
-        detection_window = epoch_data[detection_start:detection_end, :]
+        detection_windows = epochs[:, self._detection_slice]
         
         # Simple amplitude-based detection
         # Look for positive peak in detection window
-        max_amplitude = np.max(detection_window, axis=0)
-        mean_amplitude = np.mean(max_amplitude)
+        max_amplitude = np.max(detection_windows, axis=1)
+        
+        # Apply baseline correction. Subtracting a per-channel constant
+        # shifts each peak by that constant and leaves correlations alone,
+        # so only the peaks are corrected instead of the whole epoch
+        if self._baseline_slice is not None:
+            max_amplitude -= np.mean(epochs[:, self._baseline_slice], axis=1)
+        
+        mean_amplitude = np.mean(max_amplitude, axis=1)
         
         # Template matching (optional enhancement)
         if self.p300_template is not None:
-            template_correlation = self._template_match(detection_window)
+            template_correlation = self._template_match(detection_windows)
             combined_score = 0.7 * (mean_amplitude / self.detection_threshold) + 0.3 * template_correlation
         else:
             combined_score = mean_amplitude / self.detection_threshold
@@ -357,35 +498,88 @@ class P300Detector:
         
         return confidence
     
-    def _template_match(self, detection_window: np.ndarray) -> float:
-        """Match detection window against P300 template."""
-        if self.p300_template is None:
-            return 0.0
-        
-        # Resize template to match detection window
-        template_length = len(self.p300_template)
-        window_length = len(detection_window)
-        
-        if template_length != window_length:
-            # Simple interpolation
-            x_old = np.linspace(0, 1, template_length)
-            x_new = np.linspace(0, 1, window_length)
-            template_resized = np.interp(x_new, x_old, self.p300_template)
-        else:
-            template_resized = self.p300_template
-        
-        # Calculate correlation for each channel
-        correlations = []
-        for ch in range(detection_window.shape[1]):
-            channel_data = detection_window[:, ch]
-            correlation = np.corrcoef(channel_data, template_resized)[0, 1]
-            if not np.isnan(correlation):
-                correlations.append(correlation)
-        
-        if correlations:
-            return np.mean(correlations)
-        else:
-            return 0.0
+    def _epoch_slice(self, stimulus_index: int, window_samples: List[int]) -> Optional[slice]:
+        """
+        Get the epoch slice for a window relative to the stimulus.
+        
+        Args:
+            stimulus_index: Epoch index of the stimulus sample
+            window_samples: Window [start, end] in samples relative to the stimulus
+            
+        Returns:
+            Slice into the epoch, or None if the window does not fit
+        """
+        start = stimulus_index + window_samples[0]
+        end = stimulus_index + window_samples[1]
+        
+        if start < 0 or end > self.epoch_samples:
+            return None
+        
+        return slice(start, end)
+    
+    def _template_match(self, detection_windows: np.ndarray) -> np.ndarray:
+        """
+        Match detection windows against the P300 template.
+        
+        Args:
+            detection_windows: Detection windows (epochs x samples x channels)
+            
+        Returns:
+            Mean template correlation over channels for each epoch
+        """
+        n_epochs, window_length = detection_windows.shape[:2]
+        scores = np.zeros(n_epochs)
+        
+        template = self._matched_template(window_length)
+        if template is None:
+            return scores
+        
+        # Pearson correlation for every epoch and channel at once: with the
+        # template centered and unit-norm, it is one product over the sample
+        # axis divided by each centered channel's norm
+        centered = detection_windows - detection_windows.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(centered, axis=1)
+        valid = norms > 0  # Flat channels have no defined correlation
+        
+        correlations = np.einsum('s,esc->ec', template, centered)
+        correlations = np.divide(correlations, norms, out=np.zeros_like(correlations), where=valid)
+        n_valid = valid.sum(axis=1)
+        np.divide(correlations.sum(axis=1), n_valid, out=scores, where=n_valid > 0)
+        
+        return scores
+    
+    def _matched_template(self, window_length: int) -> Optional[np.ndarray]:
+        """
+        Get the P300 template resampled, centered and normalized for matching.
+        
+        Args:
+            window_length: Detection window length in samples
+            
+        Returns:
+            Unit-norm template of window_length samples, or None if unavailable
+        """
+        if window_length in self._matched_templates:
+            return self._matched_templates[window_length]
+        
+        template = None
+        if self.p300_template is not None:
+            # Resize template to match detection window
+            template_length = len(self.p300_template)
+            
+            if template_length != window_length:
+                # Simple interpolation
+                x_old = np.linspace(0, 1, template_length)
+                x_new = np.linspace(0, 1, window_length)
+                template = np.interp(x_new, x_old, self.p300_template)
+            else:
+                template = self.p300_template.astype(np.float64)
+            
+            template = template - template.mean()
+            norm = np.linalg.norm(template)
+            template = (template / norm).astype(np.float32) if norm > 0 else None
+        
+        self._matched_templates[window_length] = template
+        return template
     
     def _create_p300_template(self) -> Optional[np.ndarray]:
         """Create P300 template for matching."""
@@ -402,7 +596,7 @@ class P300Detector:
         
         template = self.config.simulation.p300_amplitude * np.exp(-(t - p300_latency_sec)**2 / (2 * (p300_width_sec/3)**2))
         
-        return template
+        return template.astype(np.float32)
     
     def _design_bandpass_filter(self):
         """Design bandpass filter for EEG preprocessing."""
@@ -416,9 +610,10 @@ class P300Detector:
             self.logger.warning("Filter frequencies exceed Nyquist frequency")
             return None
         
-        # Design Butterworth bandpass filter
+        # Design Butterworth bandpass filter. float32 coefficients keep
+        # sosfilt in float32 along with the EEG it filters
         sos = signal.butter(4, [low_freq, high_freq], btype='band', fs=self.sampling_rate, output='sos')
-        return sos
+        return sos.astype(np.float32)
     
     def _parse_flash_marker(self, marker: str) -> Optional[Dict]:
         """Parse flash marker string."""
@@ -446,7 +641,7 @@ class P300Detector:
             'is_running': self.is_running,
             'eeg_connected': self.eeg_inlet is not None,
             'flash_connected': self.flash_inlet is not None,
-            'buffer_size': len(self.eeg_buffer),
+            'buffer_size': self._buffer_count,
             'pending_events': len(self.flash_events),
             'detection_threshold': self.detection_threshold,
             'min_confidence': self.min_confidence
@@ -462,7 +657,7 @@ if __name__ == "__main__":
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
     sys.path.insert(0, project_root)
     
-    from config.config_loader import get_config
+    from config.config_loader import get_config, update_config
     
     # Setup logging
     logging.basicConfig(
@@ -477,7 +672,7 @@ if __name__ == "__main__":
     config = get_config()
     
     # Enable debug mode for testing
-    config.feedback.debug_mode = True
+    config = update_config(config, 'feedback', debug_mode=True)
     
     # Create and start detector
     detector = P300Detector(config)
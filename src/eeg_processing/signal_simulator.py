@@ -17,6 +17,26 @@ import logging
 import pylsl as lsl
 
 
+def _chunked_outlet(info: lsl.StreamInfo, chunk_size: int) -> lsl.StreamOutlet:
+    """
+    Create an outlet for chunked EEG data.
+    
+    Args:
+        info: Stream description
+        chunk_size: Samples per pushed chunk, so liblsl transmits whole chunks
+        
+    Returns:
+        Outlet using liblsl's zero-copy synchronous transport when available
+    """
+    transport_flags = getattr(lsl, 'transp_sync_blocking', None)
+    if transport_flags is not None:
+        try:
+            return lsl.StreamOutlet(info, chunk_size=chunk_size, transport_flags=transport_flags)
+        except TypeError:
+            pass  # pylsl without transport_flags support
+    return lsl.StreamOutlet(info, chunk_size=chunk_size)
+
+
 class EEGSignalSimulator:
     """
     Simulates realistic EEG signals with P300 responses.
@@ -47,6 +67,20 @@ class EEGSignalSimulator:
         self.add_artifacts = config.simulation.add_artifacts
         self.artifact_rate = config.simulation.artifact_rate
         
+        # Per-channel weights (config is immutable, so resolve channel names once)
+        channel_names = config.eeg.channel_names[:self.n_channels]
+        # P300 is strongest at central electrodes
+        self._p300_weights = np.array(
+            [1.0 if name in ('Cz', 'C3', 'C4', 'Pz') else 0.7 for name in channel_names]
+        )
+        # Eye blinks are strongest in frontal channels
+        self._blink_weights = np.array(
+            [1.0 if name in ('Fp1', 'Fp2', 'F3', 'F4') else 0.3 for name in channel_names]
+        )
+        
+        # Random generator (PCG64; faster than the legacy global np.random state)
+        self._rng = np.random.default_rng()
+        
         # Internal state
         self._time_offset = 0.0
         self._sample_count = 0
@@ -69,28 +103,28 @@ class EEGSignalSimulator:
         generators['alpha'] = {
             'frequency': 10.0,
             'amplitude': self.noise_amplitude * 0.6,
-            'phase': np.random.uniform(0, 2*np.pi, self.n_channels)
+            'phase': self._rng.uniform(0, 2*np.pi, self.n_channels)
         }
         
         # Beta waves (13-30 Hz) - mental activity
         generators['beta'] = {
             'frequency': 20.0,
             'amplitude': self.noise_amplitude * 0.3,
-            'phase': np.random.uniform(0, 2*np.pi, self.n_channels)
+            'phase': self._rng.uniform(0, 2*np.pi, self.n_channels)
         }
         
         # Theta waves (4-8 Hz) - drowsiness/meditation
         generators['theta'] = {
             'frequency': 6.0,
             'amplitude': self.noise_amplitude * 0.2,
-            'phase': np.random.uniform(0, 2*np.pi, self.n_channels)
+            'phase': self._rng.uniform(0, 2*np.pi, self.n_channels)
         }
         
         # High-frequency noise
         generators['gamma'] = {
             'frequency': 40.0,
             'amplitude': self.noise_amplitude * 0.1,
-            'phase': np.random.uniform(0, 2*np.pi, self.n_channels)
+            'phase': self._rng.uniform(0, 2*np.pi, self.n_channels)
         }
         
         return generators
@@ -107,7 +141,7 @@ class EEGSignalSimulator:
             self._p300_events.append((current_time, is_target))
             
             if self.config.feedback.debug_mode:
-                self.logger.debug(f"Added stimulus marker at {current_time:.3f}s, target={is_target}")
+                self.logger.debug("Added stimulus marker at %.3fs, target=%s", current_time, is_target)
     
     def generate_samples(self, n_samples: int) -> Tuple[np.ndarray, List[float]]:
         """
@@ -118,7 +152,7 @@ class EEGSignalSimulator:
             
         Returns:
             Tuple of (eeg_data, timestamps)
-            - eeg_data: Shape (n_samples, n_channels) in microvolts
+            - eeg_data: Shape (n_samples, n_channels) in microvolts (float32)
             - timestamps: List of timestamps for each sample
         """
         with self._lock:
@@ -127,8 +161,8 @@ class EEGSignalSimulator:
             end_time = (self._sample_count + n_samples) / self.sampling_rate
             time_array = np.linspace(start_time, end_time, n_samples, endpoint=False)
             
-            # Initialize output array
-            eeg_data = np.zeros((n_samples, self.n_channels))
+            # Initialize output array (float32 to match the LSL stream format)
+            eeg_data = np.zeros((n_samples, self.n_channels), dtype=np.float32)
             
             # Generate background EEG activity
             eeg_data += self._generate_background_noise(time_array)
@@ -140,9 +174,9 @@ class EEGSignalSimulator:
             if self.add_artifacts:
                 eeg_data += self._generate_artifacts(time_array)
             
-            # Add white noise
-            white_noise = np.random.normal(0, self.noise_amplitude * 0.1, 
-                                         (n_samples, self.n_channels))
+            # Add white noise (drawn directly as float32)
+            white_noise = self._rng.standard_normal((n_samples, self.n_channels), dtype=np.float32)
+            white_noise *= self.noise_amplitude * 0.1
             eeg_data += white_noise
             
             # Update sample count
@@ -159,22 +193,18 @@ class EEGSignalSimulator:
         n_samples = len(time_array)
         background = np.zeros((n_samples, self.n_channels))
         
+        # Slight frequency drift, shared by all rhythms (column for broadcasting)
+        freq_drift = 1 + 0.1 * np.sin(2 * np.pi * time_array * 0.1)
+        drifted_phase = (2 * np.pi * freq_drift * time_array)[:, None]
+        
         for wave_type, params in self._noise_generators.items():
-            freq = params['frequency']
-            amp = params['amplitude']
-            phases = params['phase']
-            
-            # Generate sinusoidal components with slight frequency drift
-            freq_drift = 1 + 0.1 * np.sin(2 * np.pi * time_array * 0.1)
-            
-            for ch in range(self.n_channels):
-                wave = amp * np.sin(2 * np.pi * freq * freq_drift * time_array + phases[ch])
-                
-                # Add slight amplitude modulation
-                amp_mod = 1 + 0.2 * np.sin(2 * np.pi * time_array * 0.05)
-                wave *= amp_mod
-                
-                background[:, ch] += wave
+            # Sinusoidal component for all channels at once (samples x channels)
+            background += params['amplitude'] * np.sin(
+                params['frequency'] * drifted_phase + params['phase']
+            )
+        
+        # Add slight amplitude modulation
+        background *= (1 + 0.2 * np.sin(2 * np.pi * time_array * 0.05))[:, None]
         
         return background
     
@@ -199,14 +229,7 @@ class EEGSignalSimulator:
                 p300_component = self._create_p300_waveform(time_array, p300_peak_time)
                 
                 # Distribute across channels (strongest at central electrodes)
-                for ch in range(self.n_channels):
-                    # Simulate electrode distance from central sites
-                    if self.config.eeg.channel_names[ch] in ['Cz', 'C3', 'C4', 'Pz']:
-                        channel_weight = 1.0
-                    else:
-                        channel_weight = 0.7
-                    
-                    p300_signal[:, ch] += p300_component * channel_weight
+                p300_signal += np.outer(p300_component, self._p300_weights)
         
         return p300_signal
     
@@ -252,51 +275,37 @@ class EEGSignalSimulator:
         n_samples = len(time_array)
         artifacts = np.zeros((n_samples, self.n_channels))
         
-        # Eye blinks (large, slow deflections)
+        # Eye blinks (large, slow deflections); draw all onsets in one call
         blink_probability = self.artifact_rate / self.sampling_rate
-        for i, t in enumerate(time_array):
-            if np.random.random() < blink_probability:
-                # Generate eye blink (duration ~200ms)
-                blink_duration = 0.2
-                blink_start = max(0, i - int(blink_duration * self.sampling_rate // 2))
-                blink_end = min(n_samples, i + int(blink_duration * self.sampling_rate // 2))
-                
-                # Blink amplitude (much larger than EEG)
-                blink_amplitude = self.noise_amplitude * 5
+        blink_half_width = int(0.2 * self.sampling_rate // 2)  # ~200ms blink
+        blink_amplitude = self.noise_amplitude * 5  # Much larger than EEG
+        for i in np.flatnonzero(self._rng.random(n_samples) < blink_probability):
+            blink_start = max(0, i - blink_half_width)
+            blink_end = min(n_samples, i + blink_half_width)
+            
+            # Exponential decay shape
+            blink_samples = blink_end - blink_start
+            if blink_samples > 0:
+                blink_shape = np.exp(-np.linspace(0, 3, blink_samples))
                 
-                # Exponential decay shape
-                blink_samples = blink_end - blink_start
-                if blink_samples > 0:
-                    blink_shape = np.exp(-np.linspace(0, 3, blink_samples))
-                    
-                    # Stronger in frontal channels
-                    for ch in range(self.n_channels):
-                        if self.config.eeg.channel_names[ch] in ['Fp1', 'Fp2', 'F3', 'F4']:
-                            weight = 1.0
-                        else:
-                            weight = 0.3
-                        
-                        artifacts[blink_start:blink_end, ch] += (
-                            blink_amplitude * blink_shape * weight
-                        )
+                # Stronger in frontal channels
+                artifacts[blink_start:blink_end, :] += np.outer(
+                    blink_amplitude * blink_shape, self._blink_weights
+                )
         
         # Muscle artifacts (high-frequency bursts)
         muscle_probability = self.artifact_rate * 0.5 / self.sampling_rate
-        for i, t in enumerate(time_array):
-            if np.random.random() < muscle_probability:
-                # Short burst of high-frequency activity
-                burst_duration = 0.05  # 50ms
-                burst_start = i
-                burst_end = min(n_samples, i + int(burst_duration * self.sampling_rate))
-                
-                burst_samples = burst_end - burst_start
-                if burst_samples > 0:
-                    # High-frequency noise
-                    muscle_noise = np.random.normal(
-                        0, self.noise_amplitude * 2, 
-                        (burst_samples, self.n_channels)
-                    )
-                    artifacts[burst_start:burst_end, :] += muscle_noise
+        burst_length = int(0.05 * self.sampling_rate)  # 50ms
+        for burst_start in np.flatnonzero(self._rng.random(n_samples) < muscle_probability):
+            burst_end = min(n_samples, burst_start + burst_length)
+            
+            burst_samples = burst_end - burst_start
+            if burst_samples > 0:
+                # High-frequency noise
+                artifacts[burst_start:burst_end, :] += self._rng.normal(
+                    0, self.noise_amplitude * 2,
+                    (burst_samples, self.n_channels)
+                )
         
         return artifacts
     
@@ -334,6 +343,7 @@ class SimulatedEEGStreamer:
         
         # EEG simulation
         self.simulator = EEGSignalSimulator(config)
+        self.chunk_size = max(1, int(config.eeg.sampling_rate * 0.04))  # 40ms chunks
         
         # LSL outlets (we create these)
         self.eeg_outlet = None
@@ -351,6 +361,7 @@ class SimulatedEEGStreamer:
         self.streaming_thread = None
         self.listener_thread = None
         self.is_running = False
+        self.ready = threading.Event()  # Set once streaming has started
         
         # Chess state
         self.current_target = None
@@ -386,6 +397,7 @@ class SimulatedEEGStreamer:
             return
         
         self.is_running = False
+        self.ready.clear()
         
         # Wait for threads
         if self.streaming_thread:
@@ -431,7 +443,7 @@ class SimulatedEEGStreamer:
             ch.append_child_value("unit", "microvolts")
             ch.append_child_value("type", "EEG")
         
-        self.eeg_outlet = lsl.StreamOutlet(eeg_info)
+        self.eeg_outlet = _chunked_outlet(eeg_info, self.chunk_size)
         self.logger.info("✅ Created SimulatedEEG LSL outlet")
     
     def _create_response_outlet(self):
@@ -511,41 +523,46 @@ class SimulatedEEGStreamer:
     
     def _streaming_loop(self):
         """Main EEG streaming loop."""
-        chunk_size = max(1, int(self.config.eeg.sampling_rate * 0.04))  # 40ms chunks
+        # Config is immutable: read it once instead of on every chunk
+        sampling_rate = self.config.eeg.sampling_rate
+        debug_mode = self.config.feedback.debug_mode
+        chunk_size = self.chunk_size
+        target_duration = chunk_size / sampling_rate
         sample_count = 0
         
         self.logger.info(f"Starting EEG streaming loop ({chunk_size} samples/chunk)")
+        self.ready.set()
         
         try:
+            # Chunks are scheduled against absolute deadlines so sleep
+            # jitter doesn't accumulate into drift
+            next_chunk_time = time.monotonic()
+            
             while self.is_running:
-                start_time = time.time()
-                
                 # Generate EEG chunk
                 eeg_data, timestamps = self.simulator.generate_samples(chunk_size)
                 sample_count += chunk_size
                 
-                # Stream via LSL
+                # Stream via LSL (one call per chunk)
                 if self.eeg_outlet:
-                    for i in range(len(eeg_data)):
-                        sample = eeg_data[i, :].tolist()
-                        self.eeg_outlet.push_sample(sample)
+                    self.eeg_outlet.push_chunk(eeg_data)
                 
                 # Periodic verbose output
-                if (self.config.feedback.debug_mode and 
-                    sample_count % (chunk_size * 250) == 0):  # Every ~10 seconds
+                if debug_mode and sample_count % (chunk_size * 250) == 0:  # Every ~10 seconds
                     sim_time = self.simulator.get_current_time()
                     status = "🎯 Chess connected" if self.chess_engine_connected else "⏳ Waiting for chess engine"
                     self.logger.info(f"📊 Streaming: {sim_time:.1f}s | Target: {self.current_target} | {status}")
                 
                 # Maintain real-time rate
-                elapsed = time.time() - start_time
-                target_duration = chunk_size / self.config.eeg.sampling_rate
-                sleep_time = target_duration - elapsed
+                next_chunk_time += target_duration
+                sleep_time = next_chunk_time - time.monotonic()
                 
                 if sleep_time > 0:
                     time.sleep(sleep_time)
-                elif sleep_time < -0.01:
+                elif sleep_time < -0.1:
+                    # Too far behind to catch up smoothly: resynchronize
                     self.logger.warning(f"Streaming {-sleep_time*1000:.1f}ms behind")
+                    next_chunk_time = time.monotonic()
         
         except Exception as e:
             self.logger.error(f"Streaming loop error: {e}")
@@ -558,10 +575,10 @@ class SimulatedEEGStreamer:
         
         try:
             while self.is_running:
-                # Check for target commands
+                # Check for target commands (rare: poll without blocking)
                 if self.target_inlet:
                     try:
-                        marker, timestamp = self.target_inlet.pull_sample(timeout=0.1)
+                        marker, timestamp = self.target_inlet.pull_sample(timeout=0.0)
                         if marker:
                             self._handle_target_command(marker[0])
                             if not self.chess_engine_connected:
@@ -570,16 +587,18 @@ class SimulatedEEGStreamer:
                     except:
                         pass
                 
-                # Check for flash commands
+                # Check for flash commands. The simulated P300 is timed from
+                # when a flash is handled, so wait on this inlet: liblsl wakes
+                # us as soon as a flash arrives instead of after a fixed sleep
                 if self.flash_inlet:
                     try:
-                        marker, timestamp = self.flash_inlet.pull_sample(timeout=0.1)
+                        marker, timestamp = self.flash_inlet.pull_sample(timeout=0.05)
                         if marker:
                             self._handle_flash_command(marker[0])
                     except:
                         pass
-                
-                time.sleep(0.01)  # Small delay
+                else:
+                    time.sleep(0.05)  # Nothing to wait on
         
         except Exception as e:
             self.logger.error(f"Chess listener error: {e}")
@@ -622,7 +641,7 @@ class SimulatedEEGStreamer:
                                 response = f"p300_detected|square={flashed_square}|confidence=1.0"
                                 self.response_outlet.push_sample([response])
                         else:
-                            self.logger.debug(f"Non-target flash: {flashed_square}")
+                            self.logger.debug("Non-target flash: %s", flashed_square)
                         
                         # Tell simulator to generate P300 if target
                         self.simulator.add_stimulus_marker(is_target=is_target)
@@ -656,7 +675,7 @@ if __name__ == "__main__":
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
     sys.path.insert(0, project_root)
     
-    from config.config_loader import get_config
+    from config.config_loader import get_config, update_config
     
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='EEG Signal Simulator')
@@ -678,12 +697,11 @@ if __name__ == "__main__":
     # Load config
     config = get_config()
     if args.verbose:
-        config.feedback.debug_mode = True
+        config = update_config(config, 'feedback', debug_mode=True)
     
     # Disable P300 if requested
     if args.no_p300:
-        config.simulation.p300_amplitude = 0.0
-        config.simulation.p300_probability = 0.0
+        config = update_config(config, 'simulation', p300_amplitude=0.0, p300_probability=0.0)
     
     if args.standalone:
         # Standalone mode - just stream EEG without chess integration
@@ -714,11 +732,13 @@ if __name__ == "__main__":
             ch.append_child_value("unit", "microvolts")
             ch.append_child_value("type", "EEG")
         
-        eeg_outlet = lsl.StreamOutlet(eeg_info)
-        print("✅ Created StandaloneEEG LSL outlet")
-        
         # Simple streaming loop
         chunk_size = max(1, int(config.eeg.sampling_rate * 0.04))  # 40ms chunks
+        
+        eeg_outlet = _chunked_outlet(eeg_info, chunk_size)
+        print("✅ Created StandaloneEEG LSL outlet")
+        
+        target_duration = chunk_size / config.eeg.sampling_rate
         sample_count = 0
         
         print(f"📡 Streaming {config.eeg.sampling_rate}Hz EEG data...")
@@ -727,33 +747,31 @@ if __name__ == "__main__":
         print("\nPress Ctrl+C to stop...")
         
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
+            next_chunk_time = start_time
             
             while True:
-                loop_start = time.time()
-                
                 # Generate EEG chunk
                 eeg_data, timestamps = simulator.generate_samples(chunk_size)
                 sample_count += chunk_size
                 
-                # Stream via LSL
-                for i in range(len(eeg_data)):
-                    sample = eeg_data[i, :].tolist()
-                    eeg_outlet.push_sample(sample)
+                # Stream via LSL (one call per chunk)
+                eeg_outlet.push_chunk(eeg_data)
                 
                 # Show status every 5 seconds
                 if sample_count % (chunk_size * 125) == 0:  # ~5 seconds
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     sim_time = simulator.get_current_time()
                     print(f"📊 Streaming: {sim_time:.1f}s | Samples: {sample_count} | Real time: {elapsed:.1f}s")
                 
-                # Maintain real-time rate
-                elapsed = time.time() - loop_start
-                target_duration = chunk_size / config.eeg.sampling_rate
-                sleep_time = target_duration - elapsed
+                # Maintain real-time rate against absolute deadlines
+                next_chunk_time += target_duration
+                sleep_time = next_chunk_time - time.monotonic()
                 
                 if sleep_time > 0:
                     time.sleep(sleep_time)
+                elif sleep_time < -0.1:
+                    next_chunk_time = time.monotonic()
         
         except KeyboardInterrupt:
             print("\n🛑 Stopping standalone EEG generator...")
@@ -768,7 +786,7 @@ if __name__ == "__main__":
         
         # Enable verbose if requested
         if args.verbose:
-            config.feedback.debug_mode = True
+            config = update_config(config, 'feedback', debug_mode=True)
         
         # Create and start system
         streamer = SimulatedEEGStreamer(config)
@@ -40,13 +40,15 @@ class EEGVisualizer:
         self.channel_names = config.eeg.channel_names
         
         # Data buffers
-        self.buffer_size = int(self.time_window * self.sampling_rate)
-        self.eeg_buffer = deque(maxlen=self.buffer_size)
-        self.time_buffer = deque(maxlen=self.buffer_size)
-        
-        # Event tracking
-        self.flash_events = []  # [(time, square_name, color)]
-        self.p300_events = []  # [(time, square_name, confidence)]
+        self._allocate_buffers()
+        self._max_chunk = max(1, self.sampling_rate // 10)  # Samples per pull (100 ms)
+        self._chunk_buf = None  # liblsl pulls float32 chunks straight into this
+        self._pad_buf = None  # Zero-padded chunks when the stream has too few channels
+        
+        # Event tracking (bounded; events older than the window are trimmed)
+        self.max_events = 256
+        self.flash_events = deque(maxlen=self.max_events)  # [(time, square_name, color)]
+        self.p300_events = deque(maxlen=self.max_events)  # [(time, square_name, confidence)]
         self.target_square = None
         
         # LSL connections
@@ -76,6 +78,16 @@ class EEGVisualizer:
             'target_flash': '#ff1493'
         }
         
+    def _allocate_buffers(self):
+        """Preallocate the EEG display buffers for the current time window."""
+        # Samples are written into preallocated arrays twice the display
+        # window long. When the end is reached, the newest window is moved
+        # back to the front, so the plot always reads one contiguous slice.
+        self.buffer_size = int(self.time_window * self.sampling_rate)
+        self.eeg_buffer = np.empty((2 * self.buffer_size, self.n_channels), dtype=np.float32)
+        self.time_buffer = np.empty(2 * self.buffer_size, dtype=np.float64)
+        self._buffer_count = 0
+    
     def start(self):
         """Start the EEG visualizer."""
         if self.is_running:
@@ -156,7 +168,24 @@ class EEGVisualizer:
             if not eeg_stream:
                 raise RuntimeError("No EEG stream found")
             
-            self.eeg_inlet = lsl.StreamInlet(eeg_stream)
+            # A display only needs recent data: cap the inlet backlog at 2s
+            self.eeg_inlet = lsl.StreamInlet(
+                eeg_stream, max_buflen=2, max_chunklen=self._max_chunk,
+                processing_flags=lsl.proc_ALL
+            )
+            stream_channels = eeg_stream.channel_count()
+            self._chunk_buf = None
+            if eeg_stream.channel_format() == lsl.cf_float32:
+                self._chunk_buf = np.empty((self._max_chunk, stream_channels), dtype=np.float32)
+            
+            # The stream layout is fixed: settle channel adaptation once here.
+            # Padding reuses one zeroed buffer whose extra channels stay zero.
+            self._pad_buf = None
+            if stream_channels > self.n_channels:
+                self.logger.info(f"Showing first {self.n_channels} of {stream_channels} EEG channels")
+            elif stream_channels < self.n_channels:
+                self.logger.warning(f"⚠️ EEG stream has {stream_channels} channels, padding to {self.n_channels}")
+                self._pad_buf = np.zeros((self._max_chunk, self.n_channels), dtype=np.float32)
             self.logger.info(f"✅ Connected to EEG: {eeg_stream.name()}")
             
         except Exception as e:
@@ -167,13 +196,13 @@ class EEGVisualizer:
         try:
             for stream in streams:
                 if stream.name() == 'ChessFlash':
-                    self.flash_inlet = lsl.StreamInlet(stream)
+                    self.flash_inlet = lsl.StreamInlet(stream, processing_flags=lsl.proc_clocksync)
                     self.logger.info("✅ Connected to ChessFlash")
                 elif stream.name() == 'P300Detection':
-                    self.p300_inlet = lsl.StreamInlet(stream)
+                    self.p300_inlet = lsl.StreamInlet(stream, processing_flags=lsl.proc_clocksync)
                     self.logger.info("✅ Connected to P300Detection")
                 elif stream.name() == 'ChessTarget':
-                    self.target_inlet = lsl.StreamInlet(stream)
+                    self.target_inlet = lsl.StreamInlet(stream, processing_flags=lsl.proc_clocksync)
                     self.logger.info("✅ Connected to ChessTarget")
         except Exception as e:
             self.logger.warning(f"Could not connect to all event streams: {e}")
@@ -229,42 +258,114 @@ class EEGVisualizer:
         
         try:
             while self.is_running:
-                # Collect EEG data
-                self._collect_eeg_data()
+                # Collect EEG data; waits inside liblsl (up to 10 ms) for
+                # new samples instead of sleeping between polls
+                self._collect_eeg_data(timeout=0.01)
                 
                 # Collect event data
                 self._collect_event_data()
-                
-                # Small delay to prevent busy waiting
-                time.sleep(0.01)
         
         except Exception as e:
             self.logger.error(f"Data collection error: {e}")
         finally:
             self.logger.info("Data collection loop ended")
     
-    def _collect_eeg_data(self):
-        """Collect EEG samples from LSL stream."""
+    def _collect_eeg_data(self, timeout: float = 0.0):
+        """
+        Collect EEG samples from LSL stream.
+        
+        Args:
+            timeout: Time to wait in liblsl for the first chunk (seconds)
+        """
         if not self.eeg_inlet:
+            time.sleep(timeout)
             return
         
         try:
-            # Pull available samples
+            # Pull available samples in chunks; only the first pull may block
             while True:
-                sample, timestamp = self.eeg_inlet.pull_sample(timeout=0.0)
-                if sample is None:
-                    break
+                samples, timestamps = self.eeg_inlet.pull_chunk(
+                    timeout=timeout, max_samples=self._max_chunk, dest_obj=self._chunk_buf
+                )
+                timeout = 0.0
+                n_pulled = len(timestamps)
+                if n_pulled:
+                    # With a destination buffer, samples land in it instead of a list
+                    if self._chunk_buf is not None:
+                        samples = self._chunk_buf[:n_pulled]
+                    else:
+                        samples = np.asarray(samples, dtype=np.float32)
+                    with self.data_lock:
+                        self._append_eeg(self._adapt_channels(samples), np.asarray(timestamps))
                 
-                with self.data_lock:
-                    self.eeg_buffer.append(sample)
-                    self.time_buffer.append(timestamp)
+                if len(timestamps) < self._max_chunk:
+                    break
         
         except Exception as e:
             self.logger.warning(f"EEG data collection error: {e}")
     
+    def _adapt_channels(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Adapt stream channels to match configuration.
+        
+        Args:
+            samples: EEG chunk from the stream (samples x channels)
+            
+        Returns:
+            Chunk with exactly n_channels channels
+        """
+        stream_channels = samples.shape[1]
+        
+        if stream_channels >= self.n_channels:
+            # Select first N channels (a view, no copy)
+            return samples[:, :self.n_channels]
+        elif self._pad_buf is not None and len(samples) <= len(self._pad_buf):
+            # Pad with zeros into the preallocated buffer
+            adapted = self._pad_buf[:len(samples)]
+        else:
+            # Pad with zeros
+            adapted = np.zeros((len(samples), self.n_channels), dtype=np.float32)
+        
+        adapted[:, :stream_channels] = samples
+        adapted[:, stream_channels:] = 0.0
+        return adapted
+    
+    def _append_eeg(self, samples: np.ndarray, timestamps: np.ndarray):
+        """
+        Append a block of samples to the display buffers.
+        
+        Args:
+            samples: EEG samples (samples x channels)
+            timestamps: LSL timestamp of each sample
+        """
+        n_new = len(timestamps)
+        count = self._buffer_count
+        
+        if n_new >= self.buffer_size:
+            # Block alone fills the window: keep only its newest samples
+            samples = samples[-self.buffer_size:]
+            timestamps = timestamps[-self.buffer_size:]
+            n_new = self.buffer_size
+            count = 0
+        elif count + n_new > len(self.time_buffer):
+            # Out of room: move the samples still within the window to the front
+            keep = self.buffer_size - n_new
+            self.eeg_buffer[:keep] = self.eeg_buffer[count - keep:count]
+            self.time_buffer[:keep] = self.time_buffer[count - keep:count]
+            count = keep
+        
+        self.eeg_buffer[count:count + n_new] = samples
+        self.time_buffer[count:count + n_new] = timestamps
+        self._buffer_count = count + n_new
+    
+    def _visible_slice(self) -> slice:
+        """Get the buffer slice holding the samples inside the display window."""
+        return slice(max(0, self._buffer_count - self.buffer_size), self._buffer_count)
+    
     def _collect_event_data(self):
         """Collect event markers from LSL streams."""
-        current_time = time.time()
+        # Markers carry LSL timestamps, so compare against the LSL clock
+        current_time = lsl.local_clock()
         
         # Collect flash events
         if self.flash_inlet:
@@ -281,7 +382,7 @@ class EEGVisualizer:
                         with self.data_lock:
                             self.flash_events.append((timestamp, flash_info['square'], color))
                             
-                        self.logger.debug(f"Flash: {flash_info['square']} at {timestamp:.3f}s")
+                        self.logger.debug("Flash: %s at %.3fs", flash_info['square'], timestamp)
             except:
                 pass
         
@@ -319,11 +420,12 @@ class EEGVisualizer:
             except:
                 pass
         
-        # Clean old events (older than display window)
+        # Clean old events (older than display window); events arrive in time order
         cutoff_time = current_time - self.time_window
         with self.data_lock:
-            self.flash_events = [(t, s, c) for t, s, c in self.flash_events if t > cutoff_time]
-            self.p300_events = [(t, s, c) for t, s, c in self.p300_events if t > cutoff_time]
+            for events in (self.flash_events, self.p300_events):
+                while events and events[0][0] <= cutoff_time:
+                    events.popleft()
     
     def _update_plot(self, frame):
         """Update plot with new data (called by animation)."""
@@ -331,12 +433,13 @@ class EEGVisualizer:
             return self.lines
         
         with self.data_lock:
-            if len(self.eeg_buffer) < 2:
+            if self._buffer_count < 2:
                 return self.lines
             
-            # Get current data
-            eeg_data = np.array(list(self.eeg_buffer))
-            time_data = np.array(list(self.time_buffer))
+            # Get current data (views into the display buffers)
+            visible = self._visible_slice()
+            eeg_data = self.eeg_buffer[visible]
+            time_data = self.time_buffer[visible]
             
             # Calculate display time range
             current_time = time_data[-1] if len(time_data) > 0 else time.time()
@@ -410,16 +513,18 @@ class EEGVisualizer:
     def _update_status_text(self):
         """Update status text display."""
         # Calculate stats
-        buffer_duration = len(self.eeg_buffer) / self.sampling_rate if self.eeg_buffer else 0
-        recent_flashes = len([t for t, _, _ in self.flash_events if t > time.time() - 10])
-        recent_p300s = len([t for t, _, _ in self.p300_events if t > time.time() - 10])
+        visible = self._visible_slice()
+        buffer_duration = (visible.stop - visible.start) / self.sampling_rate
+        recent_cutoff = lsl.local_clock() - 10
+        recent_flashes = sum(1 for t, _, _ in self.flash_events if t > recent_cutoff)
+        recent_p300s = sum(1 for t, _, _ in self.p300_events if t > recent_cutoff)
         
         # Signal quality (simple RMS calculation)
         signal_quality = "Good"
-        if self.eeg_buffer:
-            latest_samples = list(self.eeg_buffer)[-100:]  # Last 100 samples
-            if latest_samples:
-                rms = np.sqrt(np.mean(np.array(latest_samples)**2))
+        if self._buffer_count:
+            latest_samples = self.eeg_buffer[max(visible.start, visible.stop - 100):visible.stop]  # Last 100 samples
+            if len(latest_samples):
+                rms = np.sqrt(np.mean(latest_samples**2))
                 if rms > 100:
                     signal_quality = "High noise"
                 elif rms < 1:
@@ -484,7 +589,7 @@ class EEGVisualizer:
         with self.data_lock:
             return {
                 'is_running': self.is_running,
-                'buffer_size': len(self.eeg_buffer),
+                'buffer_size': min(self._buffer_count, self.buffer_size),
                 'target_square': self.target_square,
                 'recent_flashes': len(self.flash_events),
                 'recent_p300s': len(self.p300_events),
@@ -552,9 +657,7 @@ if __name__ == "__main__":
         # Override display parameters if specified
         if args.time_window:
             visualizer.time_window = args.time_window
-            visualizer.buffer_size = int(visualizer.time_window * visualizer.sampling_rate)
-            visualizer.eeg_buffer = deque(maxlen=visualizer.buffer_size)
-            visualizer.time_buffer = deque(maxlen=visualizer.buffer_size)
+            visualizer._allocate_buffers()
         
         if args.y_scale:
             visualizer.y_scale = args.y_scale
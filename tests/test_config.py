@@ -0,0 +1,271 @@
+"""
+Tests for configuration loading.
+"""
+
+import os
+import copy
+import pickle
+import dataclasses
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from config import config_loader
+from config.config_loader import (
+    Config, ConfigLoader, update_config, reload_config, invalidate_config, clear_cache
+)
+
+
+CONFIG_YAML = """\
+eeg:
+  sampling_rate: 500
+  n_channels: 2
+  channel_names: [Cz, Pz]
+  use_simulation: false
+  stream_name: TestEEG
+  future_option: 1
+p300:
+  detection_window: [250, 500]
+  epoch_length: 1200
+stimulus:
+  flash_colors:
+    normal: "#000000"
+    flash: "#FFFFFF"
+unknown_section:
+  1: one
+  true: yes
+"""
+
+# Same configuration without the non-string keys JSON can't represent
+JSON_SAFE_YAML = CONFIG_YAML.split("unknown_section:")[0]
+
+
+class ConfigTestCase(unittest.TestCase):
+    """Write configuration files into a temporary directory."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "config.yaml"
+        self.write(CONFIG_YAML)
+        clear_cache()
+        invalidate_config()
+
+        # Start every test without environment overrides, caching JSON under the temp dir
+        env = {var: value for var, value in os.environ.items() if not var.startswith('PY300_')}
+        env['XDG_CACHE_HOME'] = str(Path(self._tmp.name) / "cache")
+        patcher = mock.patch.dict(os.environ, env, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        invalidate_config()
+        clear_cache()
+        self._tmp.cleanup()
+
+    def write(self, text: str, mtime_offset: int = 0):
+        """Write the config file, optionally moving its mtime by whole seconds."""
+        self.path.write_text(text, encoding='utf-8')
+        if mtime_offset:
+            st = self.path.stat()
+            os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + mtime_offset * 1_000_000_000))
+
+
+class TestLoad(ConfigTestCase):
+
+    def test_load_values(self):
+        config = ConfigLoader(self.path).load()
+
+        self.assertEqual(config.eeg.sampling_rate, 500)
+        self.assertEqual(config.eeg.channel_names, ("Cz", "Pz"))
+        self.assertIs(config.eeg.use_simulation, False)
+        self.assertEqual(config.p300.detection_window, (250, 500))
+        self.assertEqual(dict(config.stimulus.flash_colors), {"normal": "#000000", "flash": "#FFFFFF"})
+        # Sections missing from the file keep their defaults
+        self.assertEqual(config.chess, Config().chess)
+
+    def test_unknown_keys_are_ignored(self):
+        config = ConfigLoader(self.path).load()
+        self.assertFalse(hasattr(config.eeg, 'future_option'))
+        self.assertFalse(hasattr(config, 'unknown_section'))
+
+    def test_cached_parse_matches_plain_yaml(self):
+        expected = yaml.safe_load(CONFIG_YAML)
+        st = self.path.stat()
+        key = (str(self.path.resolve()), st.st_mtime_ns, st.st_size)
+
+        cold = config_loader._load_raw(*key)
+        warm = config_loader._load_raw(*key)
+
+        self.assertEqual(cold, expected)
+        self.assertEqual(warm, expected)
+        self.assertIn(1, warm['unknown_section'])  # Non-string keys survive
+        self.assertFalse(Path(str(self.path) + '.json').exists())
+
+    def test_json_cache_skipped_for_non_string_keys(self):
+        ConfigLoader(self.path).load()
+        self.assertFalse(config_loader._json_cache_path(str(self.path.resolve())).exists())
+
+    def test_json_cache_used_by_next_process(self):
+        self.write(JSON_SAFE_YAML, mtime_offset=5)
+        first = ConfigLoader(self.path).load()
+        self.assertTrue(config_loader._json_cache_path(str(self.path.resolve())).exists())
+
+        # A fresh process has no in-memory cache and must not need the YAML parser
+        clear_cache()
+        with mock.patch.object(config_loader, '_yaml', side_effect=AssertionError("YAML parsed")):
+            second = ConfigLoader(self.path).load()
+        self.assertEqual(second, first)
+
+    def test_stale_json_cache_is_ignored(self):
+        self.write(JSON_SAFE_YAML, mtime_offset=5)
+        ConfigLoader(self.path).load()
+        clear_cache()
+
+        # Restored older file: neither newer nor the same size as the cached source
+        self.write(JSON_SAFE_YAML.replace("sampling_rate: 500", "sampling_rate: 1000"), mtime_offset=-3600)
+        self.assertEqual(ConfigLoader(self.path).load().eeg.sampling_rate, 1000)
+
+    def test_changed_file_is_reparsed(self):
+        first = ConfigLoader(self.path).load()
+        self.write(CONFIG_YAML.replace("sampling_rate: 500", "sampling_rate: 250"), mtime_offset=5)
+        second = ConfigLoader(self.path).load()
+
+        self.assertEqual(first.eeg.sampling_rate, 500)
+        self.assertEqual(second.eeg.sampling_rate, 250)
+
+    def test_older_restored_file_is_reparsed(self):
+        ConfigLoader(self.path).load()
+        self.write(CONFIG_YAML.replace("stream_name: TestEEG", "stream_name: Other"), mtime_offset=-3600)
+        self.assertEqual(ConfigLoader(self.path).load().eeg.stream_name, "Other")
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            ConfigLoader(Path(self._tmp.name) / "missing.yaml").load()
+
+    def test_validation_errors_are_collected(self):
+        self.write("eeg:\n  sampling_rate: -1\np300:\n  min_confidence: 2.0\n", mtime_offset=5)
+        with self.assertRaises(ValueError) as ctx:
+            ConfigLoader(self.path).load()
+        self.assertIn("sampling rate", str(ctx.exception))
+        self.assertIn("minimum confidence", str(ctx.exception))
+
+
+class TestEnvironmentOverrides(ConfigTestCase):
+
+    def test_overrides(self):
+        with mock.patch.dict(os.environ, {
+            'PY300_SAMPLING_RATE': '1000',
+            'PY300_USE_SIMULATION': 'True',
+            'PY300_DEBUG_MODE': 'false',
+            'PY300_STREAM_NAME': 'EnvEEG',
+        }):
+            config = ConfigLoader(self.path).load()
+
+        self.assertEqual(config.eeg.sampling_rate, 1000)
+        self.assertIs(config.eeg.use_simulation, True)
+        self.assertIs(config.feedback.debug_mode, False)
+        self.assertEqual(config.eeg.stream_name, "EnvEEG")
+
+    def test_boolean_values(self):
+        for raw, expected in (('true', True), ('TRUE', True), ('false', False), ('0', False), ('yes', False)):
+            with self.subTest(raw=raw), mock.patch.dict(os.environ, {'PY300_USE_SIMULATION': raw}):
+                self.assertIs(ConfigLoader(self.path).load().eeg.use_simulation, expected)
+
+    def test_overrides_do_not_leak_into_cache(self):
+        with mock.patch.dict(os.environ, {'PY300_SAMPLING_RATE': '1000'}):
+            ConfigLoader(self.path).load()
+        self.assertEqual(ConfigLoader(self.path).load().eeg.sampling_rate, 500)
+
+
+class TestSaveAndUpdate(ConfigTestCase):
+
+    def test_save_round_trip(self):
+        loader = ConfigLoader(self.path)
+        config = update_config(loader.load(), 'chess', engine_strength=7)
+        saved = Path(self._tmp.name) / "saved.yaml"
+
+        loader.save(config, saved)
+
+        self.assertEqual(ConfigLoader(saved).load(), config)
+        self.assertEqual(yaml.safe_load(saved.read_text())['eeg']['channel_names'], ["Cz", "Pz"])
+
+    def test_update_config(self):
+        config = ConfigLoader(self.path).load()
+        updated = update_config(config, 'eeg', stream_name="Other")
+
+        self.assertEqual(updated.eeg.stream_name, "Other")
+        self.assertEqual(config.eeg.stream_name, "TestEEG")
+        self.assertIs(updated.p300, config.p300)
+
+    def test_update_config_validates(self):
+        config = ConfigLoader(self.path).load()
+        with self.assertRaises(ValueError):
+            update_config(config, 'p300', min_confidence=1.5)
+
+    def test_config_is_frozen_and_hashable(self):
+        config = ConfigLoader(self.path).load()
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.eeg.sampling_rate = 1
+        with self.assertRaises(TypeError):
+            config.stimulus.flash_colors["flash"] = "#000000"
+
+        self.assertEqual(hash(config), hash(ConfigLoader(self.path).load()))
+
+    def test_pickle_and_deepcopy(self):
+        for config in (Config(), ConfigLoader(self.path).load()):
+            for clone in (pickle.loads(pickle.dumps(config)), copy.deepcopy(config)):
+                self.assertEqual(clone, config)
+                self.assertEqual(hash(clone), hash(config))
+                with self.assertRaises(TypeError):
+                    clone.stimulus.flash_colors["flash"] = "#000000"
+
+
+class TestReloadConfig(ConfigTestCase):
+
+    def test_unchanged_file_returns_same_instance(self):
+        first = reload_config(self.path)
+        self.assertIs(reload_config(self.path), first)
+
+    def test_changed_file_is_reloaded(self):
+        first = reload_config(self.path)
+        self.write(CONFIG_YAML.replace("epoch_length: 1200", "epoch_length: 1000"), mtime_offset=5)
+        second = reload_config(self.path)
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.p300.epoch_length, 1000)
+
+    def test_file_is_stat_once_per_reload(self):
+        reload_config(self.path)
+        resolved = str(self.path.resolve())
+        with mock.patch.object(config_loader.os, 'stat', wraps=os.stat) as stat:
+            reload_config(self.path)
+            self.write(CONFIG_YAML, mtime_offset=5)
+            stat.reset_mock()
+            reload_config(self.path)
+        self.assertEqual([c.args[0] for c in stat.call_args_list].count(resolved), 1)
+
+    def test_same_mtime_different_size_is_reloaded(self):
+        first = reload_config(self.path)
+        st = self.path.stat()
+        self.write(CONFIG_YAML.replace("stream_name: TestEEG", "stream_name: LongerName"))
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        self.assertEqual(first.eeg.stream_name, "TestEEG")
+        self.assertEqual(reload_config(self.path).eeg.stream_name, "LongerName")
+
+    def test_invalidate_forces_reload(self):
+        first = reload_config(self.path)
+        invalidate_config()
+        with mock.patch.dict(os.environ, {'PY300_STREAM_NAME': 'EnvEEG'}):
+            second = reload_config(self.path)
+
+        self.assertEqual(first.eeg.stream_name, "TestEEG")
+        self.assertEqual(second.eeg.stream_name, "EnvEEG")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,5 +3,275 @@ Tests for EEG processing.
 """
 
 import unittest
+from unittest import mock
 
-# TODO: Add EEG tests
+import numpy as np
+
+from config.config_loader import Config, update_config
+from src.eeg_processing import signal_simulator
+from src.eeg_processing.lsl_stream import RealEEGStreamer
+from src.eeg_processing.signal_simulator import EEGSignalSimulator, SimulatedEEGStreamer
+
+
+class _FakeInlet:
+    """Hand out prepared chunks the way pylsl's pull_chunk fills dest_obj."""
+
+    def __init__(self, streamer, chunks):
+        self.streamer = streamer
+        self.chunks = list(chunks)
+
+    def pull_chunk(self, timeout=0.0, max_samples=1024, dest_obj=None):
+        data, timestamps = self.chunks.pop(0)
+        if not self.chunks:
+            self.streamer.is_running = False  # Stop after this chunk
+        if dest_obj is not None:
+            dest_obj[:len(data)] = data
+            return dest_obj, list(timestamps)
+        return data.tolist(), list(timestamps)
+
+
+def _make_streamer(hardware_channels: int, n_channels: int = 2, float32: bool = True) -> RealEEGStreamer:
+    """Create a streamer wired as if _connect_to_hardware found a device (no LSL)."""
+    config = update_config(Config(), 'eeg', n_channels=n_channels,
+                           channel_names=tuple(f"Ch{i}" for i in range(n_channels)))
+    streamer = RealEEGStreamer(config)
+    streamer._max_chunk = 10
+    streamer.hardware_rate = 250.0
+    streamer.hardware_channels = hardware_channels
+    streamer._chunk_buf = np.empty((10, hardware_channels), dtype=np.float32) if float32 else None
+    streamer._pad_buf = (np.zeros((10, n_channels), dtype=np.float32)
+                         if hardware_channels < n_channels else None)
+    return streamer
+
+
+class StreamerTestCase(unittest.TestCase):
+    """Run the streaming loop over prepared chunks."""
+
+    def stream(self, streamer, chunks, callback=None) -> list:
+        """Run the streaming loop over chunks; return what was pushed (copied at push time)."""
+        pushed = []
+        streamer.input_inlet = _FakeInlet(streamer, chunks)
+        streamer.output_outlet = mock.Mock()
+        streamer.output_outlet.push_chunk.side_effect = (
+            lambda data, timestamps: pushed.append((np.array(data), list(timestamps)))
+        )
+        streamer.processing_callback = callback
+        streamer.is_running = True
+        streamer._streaming_loop()
+        return pushed
+
+    def chunks(self, n_channels: int, sizes=(10, 3, 7)) -> list:
+        """Random float32 chunks with consecutive timestamps."""
+        rng = np.random.default_rng(0)
+        chunks, start = [], 0
+        for size in sizes:
+            chunks.append((rng.normal(size=(size, n_channels)).astype(np.float32),
+                           np.arange(start, start + size) / 250.0))
+            start += size
+        return chunks
+
+
+class TestRealEEGStreamer(StreamerTestCase):
+    """Chunk forwarding from the hardware inlet to the ProcessedEEG outlet."""
+
+    def test_chunks_forwarded_unchanged(self):
+        for float32 in (True, False):
+            with self.subTest(float32=float32):
+                chunks = self.chunks(2)
+                pushed = self.stream(_make_streamer(2, float32=float32), chunks)
+
+                self.assertEqual(len(pushed), len(chunks))
+                for (data, timestamps), (expected, expected_times) in zip(pushed, chunks):
+                    np.testing.assert_array_equal(data, expected)
+                    self.assertEqual(timestamps, list(expected_times))
+
+    def test_callback_result_is_forwarded(self):
+        seen = []
+
+        def callback(data, timestamps):
+            seen.append(data.copy())
+            return data * 2
+
+        chunks = self.chunks(2)
+        pushed = self.stream(_make_streamer(2), chunks, callback)
+
+        for (data, _), (expected, _), copy in zip(pushed, chunks, seen):
+            np.testing.assert_array_equal(copy, expected)
+            np.testing.assert_array_equal(data, expected * 2)
+
+    def test_callback_errors_forward_raw_data(self):
+        chunks = self.chunks(2)
+        with self.assertLogs('src.eeg_processing.lsl_stream', level='WARNING'):
+            pushed = self.stream(_make_streamer(2), chunks, mock.Mock(side_effect=RuntimeError("boom")))
+        np.testing.assert_array_equal(pushed[0][0], chunks[0][0])
+
+
+class TestAdaptChannels(StreamerTestCase):
+    """Hardware channel adaptation settled at connect time."""
+
+    def test_channel_count_adapted_in_stream(self):
+        narrow = self.chunks(1)
+        for (data, _), (expected, _) in zip(self.stream(_make_streamer(1), narrow), narrow):
+            np.testing.assert_array_equal(data, np.hstack([expected, np.zeros_like(expected)]))
+
+        wide = self.chunks(4)
+        for (data, _), (expected, _) in zip(self.stream(_make_streamer(4), wide), wide):
+            np.testing.assert_array_equal(data, expected[:, :2])
+
+    def test_selection_is_a_view(self):
+        streamer = _make_streamer(4)
+        data = np.arange(12, dtype=np.float32).reshape(3, 4)
+        adapted = streamer._adapt_channels(data)
+        self.assertTrue(np.shares_memory(adapted, data))
+        np.testing.assert_array_equal(adapted, data[:, :2])
+
+    def test_padding_reuses_buffer(self):
+        streamer = _make_streamer(1, n_channels=3)
+        first = streamer._adapt_channels(np.ones((4, 1), dtype=np.float32))
+        second = streamer._adapt_channels(np.full((2, 1), 5.0, dtype=np.float32))
+
+        self.assertTrue(np.shares_memory(first, streamer._pad_buf))
+        self.assertTrue(np.shares_memory(second, streamer._pad_buf))
+        np.testing.assert_array_equal(second, [[5.0, 0.0, 0.0]] * 2)
+
+    def test_unexpected_shapes_fall_back_to_fresh_padding(self):
+        streamer = _make_streamer(1, n_channels=3)
+        oversized = streamer._adapt_channels(np.ones((12, 1), dtype=np.float32))
+        callback_output = streamer._adapt_channels(np.ones((2, 2), dtype=np.float32))
+
+        self.assertFalse(np.shares_memory(oversized, streamer._pad_buf))
+        np.testing.assert_array_equal(oversized, [[1.0, 0.0, 0.0]] * 12)
+        np.testing.assert_array_equal(callback_output, [[1.0, 1.0, 0.0]] * 2)
+
+
+
+class _FakeClock:
+    """Stand-in for the time module: sleeping advances the clock, with a little oversleep."""
+
+    def __init__(self, oversleep: float = 0.001):
+        self.now = 100.0
+        self.oversleep = oversleep
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds + self.oversleep
+
+
+class TestSimulatedStreaming(unittest.TestCase):
+    """Chunk scheduling in SimulatedEEGStreamer's streaming loop."""
+
+    def stream(self, n_chunks: int, work_time) -> tuple:
+        """Run the loop for n_chunks; work_time(i) is how long pushing chunk i takes."""
+        streamer = SimulatedEEGStreamer(Config())
+        clock = _FakeClock()
+        push_times = []
+
+        def push_chunk(data):
+            push_times.append(clock.now)
+            clock.now += work_time(len(push_times) - 1)
+            if len(push_times) == n_chunks:
+                streamer.is_running = False
+
+        streamer.eeg_outlet = mock.Mock()
+        streamer.eeg_outlet.push_chunk.side_effect = push_chunk
+        streamer.is_running = True
+        with mock.patch.object(signal_simulator, 'time', clock):
+            streamer._streaming_loop()
+
+        period = streamer.chunk_size / streamer.config.eeg.sampling_rate
+        return streamer, np.array(push_times) - push_times[0], period
+
+    def test_chunks_follow_absolute_schedule(self):
+        streamer, push_times, period = self.stream(200, work_time=lambda i: 0.003)
+
+        self.assertEqual(streamer.eeg_outlet.push_chunk.call_count, 200)
+        pushed = streamer.eeg_outlet.push_chunk.call_args.args[0]
+        self.assertEqual(pushed.shape, (streamer.chunk_size, streamer.config.eeg.n_channels))
+
+        # Work time and oversleep never accumulate into drift
+        lateness = push_times - np.arange(200) * period
+        self.assertTrue(np.all(lateness >= -1e-9))
+        self.assertLess(lateness.max(), 0.0011)
+
+    def test_late_chunk_is_caught_up(self):
+        # One slow push (less than the resync threshold) is absorbed by the following sleeps
+        streamer, push_times, period = self.stream(20, work_time=lambda i: 0.06 if i == 5 else 0.0)
+        self.assertLess(abs(push_times[-1] - 19 * period), 0.0011)
+
+    def test_resynchronizes_when_far_behind(self):
+        with self.assertLogs('src.eeg_processing.signal_simulator', level='WARNING') as logs:
+            streamer, push_times, period = self.stream(20, work_time=lambda i: 0.5 if i == 5 else 0.0)
+
+        self.assertTrue(any("behind" in line for line in logs.output))
+        # The schedule restarts after the stall instead of bursting to catch up
+        np.testing.assert_allclose(np.diff(push_times[7:]), period, atol=0.0011)
+
+
+
+class TestSignalSimulator(unittest.TestCase):
+    """Vectorized background rhythms and artifacts."""
+
+    def setUp(self):
+        config = update_config(Config(), 'eeg', sampling_rate=250, n_channels=3, channel_names=("Fp1", "Cz", "O1"))
+        self.simulator = EEGSignalSimulator(config)
+        self.time_array = np.arange(500) / 250.0
+
+    def test_background_matches_per_channel_rhythms(self):
+        t = self.time_array
+        freq_drift = 1 + 0.1 * np.sin(2 * np.pi * t * 0.1)
+        amp_mod = 1 + 0.2 * np.sin(2 * np.pi * t * 0.05)
+        expected = np.zeros((len(t), 3))
+        for params in self.simulator._noise_generators.values():
+            for ch in range(3):
+                wave = params['amplitude'] * np.sin(2 * np.pi * params['frequency'] * freq_drift * t
+                                                    + params['phase'][ch])
+                expected[:, ch] += wave * amp_mod
+
+        np.testing.assert_allclose(self.simulator._generate_background_noise(t), expected, atol=1e-9)
+
+    def test_artifacts_placed_at_drawn_onsets(self):
+        simulator = self.simulator
+        n = len(self.time_array)
+        blink_draws = np.ones(n)
+        blink_draws[[10, 300]] = 0.0
+        muscle_draws = np.ones(n)
+        muscle_draws[[200, n - 3]] = 0.0
+        simulator._rng = mock.Mock()
+        simulator._rng.random.side_effect = [blink_draws, muscle_draws]
+        simulator._rng.normal.side_effect = lambda loc, scale, size: np.full(size, 1.0)
+
+        artifacts = simulator._generate_artifacts(self.time_array)
+
+        # Blinks: 200 ms around the onset (clipped at the chunk start), stronger frontally
+        half = 25
+        shape = 5 * simulator.noise_amplitude * np.exp(-np.linspace(0, 3, 2 * half))
+        np.testing.assert_allclose(artifacts[300 - half:300 + half], np.outer(shape, [1.0, 0.3, 0.3]))
+        clipped = 5 * simulator.noise_amplitude * np.exp(-np.linspace(0, 3, 10 + half))
+        np.testing.assert_allclose(artifacts[:10 + half, 0], clipped)
+
+        # Muscle bursts: 50 ms from the onset, cut off at the chunk end
+        np.testing.assert_array_equal(artifacts[200:212], 1.0)
+        np.testing.assert_array_equal(artifacts[n - 3:], 1.0)
+        self.assertEqual(simulator._rng.normal.call_args_list[-1].args[2], (3, 3))
+
+        # Nothing anywhere else
+        mask = np.ones(n, dtype=bool)
+        for start, stop in ((0, 10 + half), (300 - half, 300 + half), (200, 212), (n - 3, n)):
+            mask[start:stop] = False
+        np.testing.assert_array_equal(artifacts[mask], 0.0)
+
+    def test_generate_samples_shape_and_time(self):
+        data, timestamps = self.simulator.generate_samples(100)
+        data2, timestamps2 = self.simulator.generate_samples(100)
+
+        self.assertEqual(data.shape, (100, 3))
+        self.assertEqual(data.dtype, np.float32)
+        np.testing.assert_allclose(timestamps + timestamps2, np.arange(200) / 250.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
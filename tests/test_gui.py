@@ -0,0 +1,112 @@
+"""
+Tests for the GUI components.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from config.config_loader import Config, update_config
+from src.gui.eeg_visualizer import EEGVisualizer
+
+
+def _make_visualizer(n_channels: int = 2) -> EEGVisualizer:
+    """Create a visualizer (no LSL connection) with a one-second display window."""
+    config = update_config(Config(), 'eeg', n_channels=n_channels, sampling_rate=100,
+                           channel_names=tuple(f"Ch{i}" for i in range(n_channels)))
+    visualizer = EEGVisualizer(config)
+    visualizer.time_window = 1.0
+    visualizer._allocate_buffers()
+    return visualizer
+
+
+class _FakeInlet:
+    """Hand out prepared chunks the way pylsl's pull_chunk fills dest_obj."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def pull_chunk(self, timeout=0.0, max_samples=1024, dest_obj=None):
+        if not self.chunks:
+            return dest_obj, []
+        data, timestamps = self.chunks.pop(0)
+        dest_obj[:len(data)] = data
+        return dest_obj, list(timestamps)
+
+
+class TestEEGDisplayBuffer(unittest.TestCase):
+    """Appending to the compacting display buffer."""
+
+    def test_append_matches_concatenation(self):
+        visualizer = _make_visualizer()
+        rng = np.random.default_rng(0)
+
+        # Chunk sizes that wrap the buffer several times, plus blocks longer than the window
+        sizes = list(rng.integers(1, 60, 30)) + [visualizer.buffer_size, 250] + list(rng.integers(1, 60, 10))
+        chunks, stamps = [], []
+        total = 0
+        for size in sizes:
+            chunks.append(rng.normal(size=(size, 2)).astype(np.float32))
+            stamps.append(np.arange(total, total + size, dtype=np.float64))
+            total += size
+            visualizer._append_eeg(chunks[-1], stamps[-1])
+
+            visible = visualizer._visible_slice()
+            n_visible = min(total, visualizer.buffer_size)
+            self.assertEqual(visible.stop - visible.start, n_visible)
+            self.assertLessEqual(visualizer._buffer_count, len(visualizer.time_buffer))
+            np.testing.assert_array_equal(visualizer.eeg_buffer[visible], np.concatenate(chunks)[-n_visible:])
+            np.testing.assert_array_equal(visualizer.time_buffer[visible], np.concatenate(stamps)[-n_visible:])
+
+    def test_oversized_block_keeps_newest_window(self):
+        visualizer = _make_visualizer()
+        visualizer._append_eeg(np.ones((30, 2), dtype=np.float32), np.arange(30.0))
+
+        block = np.arange(500, dtype=np.float32).reshape(250, 2)
+        visualizer._append_eeg(block, np.arange(30.0, 280.0))
+
+        self.assertEqual(visualizer._buffer_count, visualizer.buffer_size)
+        np.testing.assert_array_equal(visualizer.eeg_buffer[visualizer._visible_slice()], block[-100:])
+        self.assertEqual(visualizer.time_buffer[0], 180.0)
+
+
+class TestEEGChannels(unittest.TestCase):
+    """Streams whose channel count differs from the configuration."""
+
+    def collect(self, visualizer, stream_channels: int, sizes=(10, 4)) -> np.ndarray:
+        """Pull chunks through _collect_eeg_data; return them as sent by the stream."""
+        rng = np.random.default_rng(1)
+        chunks, start = [], 0
+        for size in sizes:
+            chunks.append((rng.normal(size=(size, stream_channels)).astype(np.float32),
+                           np.arange(start, start + size, dtype=np.float64)))
+            start += size
+
+        # As set up by _connect_to_streams for this stream
+        visualizer._chunk_buf = np.empty((visualizer._max_chunk, stream_channels), dtype=np.float32)
+        if stream_channels < visualizer.n_channels:
+            visualizer._pad_buf = np.zeros((visualizer._max_chunk, visualizer.n_channels), dtype=np.float32)
+        visualizer.eeg_inlet = _FakeInlet(chunks)
+        for _ in sizes:
+            visualizer._collect_eeg_data()
+        return np.concatenate([data for data, _ in chunks])
+
+    def test_narrow_stream_is_padded(self):
+        visualizer = _make_visualizer(n_channels=3)
+        with mock.patch.object(visualizer.logger, 'warning') as warning:
+            sent = self.collect(visualizer, stream_channels=1)
+
+        warning.assert_not_called()
+        shown = visualizer.eeg_buffer[visualizer._visible_slice()]
+        np.testing.assert_array_equal(shown[:, :1], sent)
+        np.testing.assert_array_equal(shown[:, 1:], 0.0)
+
+    def test_wide_stream_shows_first_channels(self):
+        visualizer = _make_visualizer(n_channels=2)
+        sent = self.collect(visualizer, stream_channels=4)
+        np.testing.assert_array_equal(visualizer.eeg_buffer[visualizer._visible_slice()], sent[:, :2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,318 @@
+"""
+Tests for the main application orchestrator.
+"""
+
+import io
+import os
+import select
+import signal
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import main
+from config.config_loader import Config
+
+
+class AppTestCase(unittest.TestCase):
+    """Create an application (no components started) and undo its signal setup afterwards."""
+
+    def setUp(self):
+        handlers = {signum: signal.getsignal(signum) for signum in (signal.SIGINT, signal.SIGTERM)}
+        for signum, handler in handlers.items():
+            self.addCleanup(signal.signal, signum, handler)
+
+        self.app = main.Py300ChessApp(Config())
+        self.addCleanup(self.app._cleanup)
+
+
+class TestComponentStatus(unittest.TestCase):
+
+    def test_mark_and_take_changes(self):
+        status = main._ComponentStatus()
+        status.mark("eeg_source", "simulated")
+        status.mark("p300_detector", "running")
+
+        items, changed = status.take_changes()
+        self.assertEqual(items, [("eeg_source", "simulated"), ("p300_detector", "running")])
+        self.assertEqual(changed, {"eeg_source", "p300_detector"})
+
+        # Nothing changed since the last snapshot
+        self.assertEqual(status.take_changes()[1], set())
+
+        status.mark("eeg_source", "hardware")
+        items, changed = status.take_changes()
+        self.assertEqual(changed, {"eeg_source"})
+        self.assertEqual(status.get("eeg_source"), "hardware")
+        self.assertEqual(status.get("chess_gui", "not_started"), "not_started")
+
+    def test_concurrent_marks(self):
+        status = main._ComponentStatus()
+
+        def mark_many(prefix):
+            for i in range(500):
+                status.mark(f"{prefix}{i}", "running")
+
+        threads = [threading.Thread(target=mark_many, args=(prefix,)) for prefix in "abcd"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        items, changed = status.take_changes()
+        self.assertEqual(len(items), 2000)
+        self.assertEqual(len(changed), 2000)
+
+
+class TestStartConcurrently(AppTestCase):
+
+    def test_starters_run_in_parallel(self):
+        def starter(result):
+            def start():
+                time.sleep(0.3)
+                return result
+            return start
+
+        start = time.monotonic()
+        results = self.app._start_concurrently([("a", starter(True)), ("b", starter(False)), ("c", starter(True))])
+
+        self.assertEqual(results, {"a": True, "b": False, "c": True})
+        self.assertLess(time.monotonic() - start, 0.8)
+
+    def test_failing_starter_is_reported(self):
+        def broken():
+            raise RuntimeError("no device")
+
+        with self.assertLogs(main.__name__, level='ERROR') as logs:
+            results = self.app._start_concurrently([("eeg", broken), ("chess", lambda: True)])
+
+        self.assertEqual(results, {"eeg": False, "chess": True})
+        self.assertIn("Failed to start eeg: no device", logs.output[0])
+
+    def test_shutdown_interrupts_startup(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        threading.Timer(0.1, self.app._shutdown_event.set).start()
+
+        start = time.monotonic()
+        with self.assertLogs(main.__name__, level='WARNING'):
+            results = self.app._start_concurrently([("slow", lambda: release.wait(10)), ("fast", lambda: True)])
+
+        self.assertEqual(results, {"fast": True, "slow": False})
+        self.assertLess(time.monotonic() - start, 2.0)
+
+
+class TestStopProcesses(AppTestCase):
+
+    def spawn(self, ignore_sigterm: bool) -> main.subprocess.Popen:
+        """Start a sleeping child, waiting until its SIGTERM handling is in place."""
+        code = ("import signal, sys, time\n"
+                f"if {ignore_sigterm}: signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+                "print('ready', flush=True)\n"
+                "time.sleep(30)\n")
+        process = main.subprocess.Popen([sys.executable, "-c", code], stdout=main.subprocess.PIPE)
+        self.addCleanup(process.stdout.close)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        process.stdout.readline()
+        return process
+
+    def test_processes_share_one_deadline(self):
+        processes = {
+            "stubborn1": self.spawn(ignore_sigterm=True),
+            "polite": self.spawn(ignore_sigterm=False),
+            "stubborn2": self.spawn(ignore_sigterm=True),
+            "stubborn3": self.spawn(ignore_sigterm=True),
+        }
+
+        start = time.monotonic()
+        with self.assertLogs(main.__name__, level='INFO'):
+            outcomes = self.app._stop_processes(processes, timeout=0.5)
+
+        self.assertEqual(outcomes, {"stubborn1": "forced", "polite": "graceful",
+                                    "stubborn2": "forced", "stubborn3": "forced"})
+        self.assertLess(time.monotonic() - start, 1.2)  # Not 0.5 s per stubborn process
+        for process in processes.values():
+            self.assertIsNotNone(process.returncode)
+
+    def test_terminate_errors_are_reported(self):
+        broken = mock.Mock(pid=1)
+        broken.terminate.side_effect = ProcessLookupError("gone")
+
+        with self.assertLogs(main.__name__, level='INFO'):
+            outcomes = self.app._stop_processes({"broken": broken}, timeout=0.1)
+
+        self.assertEqual(outcomes, {"broken": "gone"})
+        broken.wait.assert_not_called()
+
+
+class TestSignalHandling(AppTestCase):
+
+    def test_handler_only_records_signal(self):
+        self.app._signal_handler(signal.SIGTERM, None)
+
+        self.assertFalse(self.app._shutdown_event.is_set())
+        with self.assertLogs(main.__name__, level='INFO') as logs:
+            self.assertTrue(self.app._shutdown_pending())
+        self.assertIn(f"Received signal {signal.SIGTERM}", logs.output[0])
+        self.assertIsNone(self.app._pending_signal)
+
+    def test_no_signal_waits_for_timeout(self):
+        start = time.monotonic()
+        self.assertFalse(self.app._wait_for_shutdown(0.2))
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    @unittest.skipIf(sys.platform == "win32", "no signal wakeup pipe on Windows")
+    def test_signal_wakes_wait_immediately(self):
+        timer = threading.Timer(0.1, os.kill, (os.getpid(), signal.SIGTERM))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        start = time.monotonic()
+        with self.assertLogs(main.__name__, level='INFO'):
+            self.assertTrue(self.app._wait_for_shutdown(5.0))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        # The wakeup pipe was drained, so the next wait blocks again
+        self.assertEqual(select.select([self.app._wakeup_r], [], [], 0)[0], [])
+
+
+class TestStatusUpdate(AppTestCase):
+
+    def show_status(self) -> str:
+        with self.assertLogs(main.__name__, level='INFO') as logs:
+            self.app._show_status_update()
+        return logs.output[-1]
+
+    def test_status_line_follows_changes(self):
+        self.app.component_status.mark("eeg_source", "simulated")
+        self.app.component_status.mark("p300_detector", "running")
+        self.assertIn("eeg_source:simulated | p300_detector:✅", self.show_status())
+
+        # Unchanged status reuses the line; changed components are reformatted
+        self.assertIn("eeg_source:simulated | p300_detector:✅", self.show_status())
+        self.app.component_status.mark("p300_detector", "not_available")
+        self.assertIn("eeg_source:simulated | p300_detector:⚠️", self.show_status())
+
+
+class TestReadCommands(AppTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app.is_running = True
+
+    def read(self, stdin, count=None) -> list:
+        """Read commands from a replacement stdin (all of them, or the first count)."""
+        commands = []
+        with mock.patch.object(sys, 'stdin', stdin), redirect_stdout(io.StringIO()):
+            reader = self.app._read_commands("> ")
+            for command in reader:
+                commands.append(command)
+                if count is not None and len(commands) == count:
+                    reader.close()
+                    break
+        return commands
+
+    def test_regular_file(self):
+        with tempfile.TemporaryFile('w+') as f:
+            f.write("Status\nhelp\n")
+            f.seek(0)
+            self.assertEqual(self.read(f), ["status", "help"])
+
+    def test_pipe_delivers_queued_lines(self):
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, write_fd)
+        stdin = os.fdopen(read_fd)
+        self.addCleanup(stdin.close)
+
+        # Stop reading after a while if queued lines were never delivered
+        timer = threading.Timer(3.0, setattr, (self.app, 'is_running', False))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        # Several lines in one write, and the pipe stays open
+        os.write(write_fd, b"status\nhelp\nquit\n")
+        start = time.monotonic()
+        self.assertEqual(self.read(stdin, count=3), ["status", "help", "quit"])
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_pipe_partial_last_line(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"status\nhel")
+        os.write(write_fd, b"p")
+        os.close(write_fd)
+        with os.fdopen(read_fd) as stdin:
+            self.assertEqual(self.read(stdin), ["status", "help"])
+
+
+class TestExitWatcher(AppTestCase):
+
+    def test_exited_terminal_is_reported_and_closed(self):
+        process = main.subprocess.Popen([sys.executable, "-c", "pass"], stderr=main.subprocess.PIPE)
+        self.addCleanup(process.wait)
+
+        with self.assertLogs(main.__name__, level='WARNING') as logs:
+            self.app._watch_for_exit("chess_gui", process)
+            deadline = time.monotonic() + 5.0
+            while not process.stderr.closed and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertTrue(process.stderr.closed)
+        self.assertIn("chess_gui terminal closed", logs.output[0])
+        self.assertEqual(self.app._exit_selector.get_map(), {})
+
+    def test_cleanup_stops_watcher_and_closes_selector(self):
+        process = main.subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"],
+                                        stderr=main.subprocess.PIPE)
+        self.addCleanup(process.stderr.close)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+
+        self.app._watch_for_exit("chess_gui", process)
+        thread = self.app._exit_watch_thread
+        self.app._cleanup()
+
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.app._exit_selector)
+
+
+class TestTmuxWindows(AppTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app._tmux = "/usr/bin/tmux"
+        self.app._component_cpus = None
+
+    def test_window_gets_environment_and_cwd(self):
+        completed = mock.Mock(stdout="4242\n")
+        env = {"PY300_LOG_LEVEL": "DEBUG", "PYTHONPATH": "/src", "HOME": "/home/user"}
+        with mock.patch.object(main.subprocess, "run", return_value=completed) as run, \
+                mock.patch.dict(os.environ, env), \
+                mock.patch.object(self.app, "_open_tmux_viewer"):
+            window = self.app._spawn_tmux_window(["python", "component.py"], "Title", "p300_detector")
+
+        argv = run.call_args.args[0]
+        self.assertEqual(window.pid, 4242)
+        self.assertEqual(argv[:2], ["tmux", "new-session"])
+        self.assertEqual(argv[argv.index("-c") + 1], os.getcwd())
+        self.assertIn("PY300_LOG_LEVEL=DEBUG", argv)
+        self.assertIn("PYTHONPATH=/src", argv)
+        self.assertNotIn("HOME=/home/user", argv)
+
+    def test_macos_viewer_opens_terminal(self):
+        self.app._system = "darwin"
+        completed = mock.Mock(returncode=0, stdout="17\n")
+        with mock.patch.object(main.subprocess, "run", return_value=completed) as run:
+            self.app._open_tmux_viewer()
+
+        self.assertEqual(run.call_args.args[0][0], "osascript")
+        self.assertIn(f"tmux attach -t {self.app._tmux_session}", run.call_args.args[0][2])
+        self.assertEqual(self.app.terminal_pids["tmux_viewer"]["window_id"], "17")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,4 +4,163 @@ Tests for P300 detection.
 
 import unittest
 
-# TODO: Add P300 tests
+import numpy as np
+from scipy import signal
+
+from config.config_loader import Config, update_config
+from src.eeg_processing.p300_detector import P300Detector
+
+
+def _make_detector(**p300_changes) -> P300Detector:
+    """Create a two-channel detector (no LSL connection) from the default config."""
+    config = update_config(Config(), 'eeg', n_channels=2, channel_names=("Cz", "Pz"))
+    # Long enough epochs for the whole detection window to fit
+    config = update_config(config, 'p300', epoch_length=1200, **p300_changes)
+    return P300Detector(config)
+
+
+def _reference_score(detector: P300Detector, epoch: np.ndarray) -> float:
+    """Score one epoch the straightforward way: full baseline correction, corrcoef per channel."""
+    epoch = epoch.astype(np.float64)
+    stimulus = len(epoch) // 2
+
+    baseline = epoch[stimulus + detector.baseline_samples[0]:stimulus + detector.baseline_samples[1]]
+    corrected = epoch - baseline.mean(axis=0)
+    window = corrected[stimulus + detector.detection_samples[0]:stimulus + detector.detection_samples[1]]
+    mean_amplitude = window.max(axis=0).mean()
+
+    template = np.interp(
+        np.linspace(0, 1, len(window)),
+        np.linspace(0, 1, len(detector.p300_template)),
+        detector.p300_template
+    )
+    correlations = [np.corrcoef(window[:, ch], template)[0, 1] for ch in range(window.shape[1])]
+    score = 0.7 * (mean_amplitude / detector.detection_threshold) + 0.3 * np.mean(correlations)
+    return float(np.clip(score, 0.0, 1.0))
+
+
+class TestP300Detection(unittest.TestCase):
+    """Epoch extraction and batched scoring."""
+
+    def setUp(self):
+        self.detector = _make_detector(detection_threshold=20.0)
+        self.detector.bandpass_filter = None  # Score the synthetic signal as-is
+        fs = self.detector.sampling_rate
+
+        rng = np.random.default_rng(0)
+        n_samples = 4 * fs
+        data = rng.normal(0.0, 1.0, (n_samples, 2)).astype(np.float32)
+        times = np.arange(n_samples) / fs
+
+        # Stimuli at 1 s (followed by a P300 peaking 300 ms later) and 2.5 s (none)
+        self.stimulus_times = np.array([1.0, 2.5])
+        t = times - self.stimulus_times[0]
+        data += (8.0 * np.exp(-(t - 0.3) ** 2 / (2 * 0.04 ** 2)))[:, np.newaxis].astype(np.float32)
+
+        self.detector._append_eeg(data, times)
+        half_epoch = self.detector.epoch_length / 2000.0
+        self.start_indices = np.searchsorted(times, self.stimulus_times - half_epoch)
+
+    def test_extract_epochs_shape(self):
+        epochs = self.detector._extract_epochs(self.start_indices)
+
+        self.assertEqual(epochs.shape, (2, self.detector.epoch_samples, 2))
+        self.assertEqual(epochs.dtype, np.float32)
+        np.testing.assert_array_equal(
+            epochs[1],
+            self.detector._eeg_data[self.start_indices[1]:self.start_indices[1] + self.detector.epoch_samples]
+        )
+
+    def test_batched_scores_match_per_epoch(self):
+        epochs = self.detector._extract_epochs(self.start_indices)
+        scores = self.detector._detect_p300(epochs)
+
+        self.assertEqual(scores.shape, (2,))
+        for i, epoch in enumerate(epochs):
+            self.assertAlmostEqual(scores[i], _reference_score(self.detector, epoch), places=4)
+            self.assertAlmostEqual(scores[i], self.detector._detect_p300(epochs[i:i + 1])[0], places=6)
+
+    def test_p300_scores_above_null(self):
+        scores = self.detector._detect_p300(self.detector._extract_epochs(self.start_indices))
+        self.assertGreater(scores[0], scores[1])
+
+    def test_flat_channels_skipped_in_template_match(self):
+        epochs = self.detector._extract_epochs(self.start_indices)
+        epochs[:, :, 1] = 3.0
+        windows = epochs[:, self.detector._detection_slice]
+
+        expected = self.detector._template_match(windows[:, :, :1])
+        np.testing.assert_allclose(self.detector._template_match(windows), expected, rtol=1e-5)
+
+        epochs[:, :, 0] = 3.0
+        windows = epochs[:, self.detector._detection_slice]
+        np.testing.assert_array_equal(self.detector._template_match(windows), [0.0, 0.0])
+
+    def test_only_ready_events_are_processed(self):
+        detector = self.detector
+        detector.min_confidence = 2.0  # Never send responses
+        latest = detector._eeg_times[detector._buffer_count - 1]
+        for timestamp in (1.0, 2.5, latest - 0.1):  # The last one's epoch isn't complete yet
+            detector.flash_events.append({'square': 'e4', 'timestamp': timestamp, 'type': 'flash'})
+
+        self.assertEqual(detector._process_pending_epochs(), 2)
+        self.assertEqual([event['timestamp'] for event in detector.flash_events], [latest - 0.1])
+
+
+class TestEEGBuffer(unittest.TestCase):
+    """Appending to the compacting EEG buffer."""
+
+    def test_append_matches_concatenation(self):
+        detector = _make_detector()
+        detector.bandpass_filter = None
+        rng = np.random.default_rng(1)
+
+        # Chunk sizes that force several compactions, plus one longer than the buffer
+        sizes = list(rng.integers(1, 400, 40)) + [detector.buffer_samples + 10] + list(rng.integers(1, 400, 10))
+        chunks, stamps = [], []
+        total = 0
+        for size in sizes:
+            chunks.append(rng.normal(size=(size, 2)).astype(np.float32))
+            stamps.append(np.arange(total, total + size, dtype=np.float64))
+            total += size
+            detector._append_eeg(chunks[-1], stamps[-1])
+
+            expected_data = np.concatenate(chunks)
+            expected_times = np.concatenate(stamps)
+            count = detector._buffer_count
+
+            self.assertGreaterEqual(count, min(total, detector.buffer_samples))
+            self.assertLessEqual(count, len(detector._eeg_times))
+            np.testing.assert_array_equal(detector._eeg_data[:count], expected_data[-count:])
+            np.testing.assert_array_equal(detector._eeg_times[:count], expected_times[-count:])
+
+    def test_causal_filter_matches_single_pass(self):
+        detector = _make_detector()
+        rng = np.random.default_rng(2)
+        data = rng.normal(0.0, 10.0, (1000, 2)).astype(np.float32)
+
+        for start in range(0, len(data), 37):
+            chunk = data[start:start + 37]
+            detector._append_eeg(chunk, np.arange(start, start + len(chunk), dtype=np.float64))
+
+        sos = detector.bandpass_filter
+        zi = signal.sosfilt_zi(sos)[:, :, np.newaxis] * data[0]
+        expected, _ = signal.sosfilt(sos, data, axis=0, zi=zi.astype(np.float32))
+        np.testing.assert_allclose(detector._eeg_data[:detector._buffer_count], expected, rtol=1e-4, atol=1e-4)
+
+    def test_append_rejects_wrong_channel_count(self):
+        detector = _make_detector()
+        with self.assertRaises(ValueError):
+            detector._append_eeg(np.zeros((5, 3), dtype=np.float32), np.arange(5.0))
+
+    def test_adapt_channels_pads_and_selects(self):
+        detector = _make_detector()
+        narrow = np.ones((4, 1), dtype=np.float32)
+        wide = np.arange(12, dtype=np.float32).reshape(4, 3)
+
+        np.testing.assert_array_equal(detector._adapt_channels(narrow), [[1.0, 0.0]] * 4)
+        np.testing.assert_array_equal(detector._adapt_channels(wide), wide[:, :2])
+
+
+if __name__ == '__main__':
+    unittest.main()